@@ -18,8 +18,10 @@ logger = logging.getLogger(__name__)
 class DatabaseManager:
     """Async database manager with a single engine and session factory."""
 
-    def __init__(self, database_url: str) -> None:
+    def __init__(self, database_url: str, *, pool_size: Optional[int] = None, max_overflow: Optional[int] = None) -> None:
         self._database_url = database_url
+        self._pool_size = pool_size
+        self._max_overflow = max_overflow
         self._engine: Optional[AsyncEngine] = None
         self._sessionmaker: Optional[async_sessionmaker[AsyncSession]] = None
 
@@ -29,10 +31,19 @@ class DatabaseManager:
             return
 
         logger.info("Initializing async database engine")
+        pool_kwargs: dict[str, int] = {}
+        # Only QueuePool-backed dialects take sizing arguments; SQLite (NullPool for files, StaticPool
+        # for :memory:) rejects them, and its connections are cheap to open per session anyway
+        if not self._database_url.startswith("sqlite"):
+            if self._pool_size is not None:
+                pool_kwargs["pool_size"] = self._pool_size
+            if self._max_overflow is not None:
+                pool_kwargs["max_overflow"] = self._max_overflow
         self._engine = create_async_engine(
             self._database_url,
             echo=False,
             future=True,
+            **pool_kwargs,
         )
 
         # SQLite-specific pragmas for better safety and concurrency.
@@ -92,12 +103,16 @@ class DatabaseManager:
 _db_manager: Optional[DatabaseManager] = None
 
 
-async def init_database(database_url: str) -> None:
-    """Create and initialize the global DatabaseManager singleton."""
+async def init_database(database_url: str, *, pool_size: Optional[int] = None, max_overflow: Optional[int] = None) -> None:
+    """
+    Create and initialize the global DatabaseManager singleton.
+    pool_size / max_overflow size the connection pool (library defaults when None); one-shot CLI tools
+    that hold a single session pass pool_size=1, max_overflow=0.
+    """
     global _db_manager
 
     if _db_manager is None:
-        _db_manager = DatabaseManager(database_url)
+        _db_manager = DatabaseManager(database_url, pool_size=pool_size, max_overflow=max_overflow)
     await _db_manager.init()
 
 
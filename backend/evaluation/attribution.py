@@ -9,6 +9,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 
 @dataclass
 class ReasonAttributionRow:
@@ -19,27 +24,42 @@ class ReasonAttributionRow:
     outcome: str  # SUCCESS | FAILURE | NEUTRAL | UNRESOLVED
 
 
+_MARKETS = ("one_x_two", "over_under_25", "gg_ng")
+
+
+def _decode(raw: Any) -> Any:
+    """Decode a JSON string; other values pass through. Invalid JSON -> None."""
+    if isinstance(raw, (str, bytes)):
+        try:
+            return _json_loads(raw)
+        except (TypeError, ValueError):
+            return None
+    return raw
+
+
+def coerce_reason_codes_by_market(raw: Any) -> Dict[str, List[str]]:
+    """reason_codes_by_market from an already-decoded dict or its JSON string (parsed once)."""
+    raw = _decode(raw)
+    if not isinstance(raw, dict):
+        return {m: [] for m in _MARKETS}
+    return {m: list(raw.get(m) or []) for m in _MARKETS}
+
+
+def coerce_market_outcomes(raw: Any) -> Dict[str, str]:
+    """market_outcomes from an already-decoded dict or its JSON string (parsed once)."""
+    raw = _decode(raw)
+    if not isinstance(raw, dict):
+        return {}
+    return dict(raw)
+
+
 def reason_codes_by_market_from_resolution(resolution: Dict[str, Any]) -> Dict[str, List[str]]:
     """Extract reason_codes_by_market from a resolution (dict or ORM-like with get)."""
     if hasattr(resolution, "get"):
         raw = resolution.get("reason_codes_by_market") or resolution.get("reason_codes_by_market_json")
     else:
         raw = getattr(resolution, "reason_codes_by_market_json", None)
-    if raw is None:
-        return {"one_x_two": [], "over_under_25": [], "gg_ng": []}
-    if isinstance(raw, str):
-        import json
-        try:
-            raw = json.loads(raw)
-        except (TypeError, ValueError):
-            return {"one_x_two": [], "over_under_25": [], "gg_ng": []}
-    if not isinstance(raw, dict):
-        return {"one_x_two": [], "over_under_25": [], "gg_ng": []}
-    return {
-        "one_x_two": list(raw.get("one_x_two") or []),
-        "over_under_25": list(raw.get("over_under_25") or []),
-        "gg_ng": list(raw.get("gg_ng") or []),
-    }
+    return coerce_reason_codes_by_market(raw)
 
 
 def market_outcomes_from_resolution(resolution: Dict[str, Any]) -> Dict[str, str]:
@@ -48,17 +68,7 @@ def market_outcomes_from_resolution(resolution: Dict[str, Any]) -> Dict[str, str
         raw = resolution.get("market_outcomes") or resolution.get("market_outcomes_json")
     else:
         raw = getattr(resolution, "market_outcomes_json", None)
-    if raw is None:
-        return {}
-    if isinstance(raw, str):
-        import json
-        try:
-            raw = json.loads(raw)
-        except (TypeError, ValueError):
-            return {}
-    if not isinstance(raw, dict):
-        return {}
-    return dict(raw)
+    return coerce_market_outcomes(raw)
 
 
 def emit_attribution_rows(
@@ -10,7 +10,7 @@ import shutil
 from pathlib import Path
 from typing import Any, Dict, List, Set, Tuple
 
-from reports.index_store import load_index, save_index
+from reports.index_store import compact_quality_audit_runs, load_index, save_index
 
 # Config: keep last N report runs (conservative default)
 DEFAULT_REPORT_RETENTION_COUNT = 200
@@ -61,6 +61,15 @@ def _collect_run_ids(index: Dict[str, Any]) -> List[str]:
     return sorted(seen)
 
 
+def _scan_entries(directory: Path) -> Dict[str, os.DirEntry]:
+    """Map entry name -> DirEntry for one directory (single scandir; type checks reuse its cached d_type)."""
+    try:
+        with os.scandir(directory) as it:
+            return {e.name: e for e in it}
+    except OSError:
+        return {}
+
+
 def _safe_under_root(path: Path, root: Path) -> bool:
     """True iff path resolves to a path under root (no traversal outside)."""
     try:
@@ -94,6 +103,9 @@ def cleanup_reports(
     if not idx_path.is_absolute():
         idx_path = reports_path / idx_path.name
 
+    # Fold pending quality audit lines first so entries pruned below cannot reappear from the sidecar
+    if not dry_run and _safe_under_root(idx_path, reports_path):
+        compact_quality_audit_runs(idx_path)
     index = load_index(idx_path)
     all_run_ids = _collect_run_ids(index)
     if len(all_run_ids) <= keep_last_n:
@@ -104,22 +116,21 @@ def cleanup_reports(
     deleted_paths: List[str] = []
     error_count = 0
 
-    # Delete artifacts only under reports_path
+    # Delete artifacts only under reports_path; each subdir is listed once instead of probing every run_id
+    listings = {subdir: _scan_entries(reports_path / subdir) for subdir, _ in _ARTIFACT_SUBDIRS}
     for run_id in sorted(to_remove_ids):
         for subdir, is_dir in _ARTIFACT_SUBDIRS:
-            if is_dir:
-                candidate = reports_path / subdir / run_id
-            else:
-                candidate = reports_path / subdir / f"{run_id}.json"
-            if not candidate.exists():
+            entry = listings[subdir].get(run_id if is_dir else f"{run_id}.json")
+            if entry is None:
                 continue
+            candidate = Path(entry.path)
             if not _safe_under_root(candidate, reports_path):
                 error_count += 1
                 continue
             deleted_paths.append(str(candidate))
             if not dry_run:
                 try:
-                    if candidate.is_dir():
+                    if entry.is_dir():
                         shutil.rmtree(candidate)
                     else:
                         candidate.unlink()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -12,12 +13,20 @@ from policy.policy_store import default_policy, default_policy_path, load_policy
 POLICY_MARKET_KEYS = ("one_x_two", "over_under_25", "gg_ng")
 
 
+@lru_cache(maxsize=4)
+def _load_policy_cached(resolved_path: str, mtime_ns: int, size: int) -> Policy:
+    """Parse + validate once per (path, mtime, size); a rewritten file gets a new key."""
+    return load_policy(resolved_path)
+
+
 def get_active_policy() -> Policy:
+    """Active policy (shared cached instance: treat as read-only)."""
     path_str = os.environ.get("POLICY_PATH")
     path: Optional[Path] = default_policy_path() if not path_str else Path(path_str)
     try:
         if path and path.is_file():
-            return load_policy(path)
+            st = path.stat()
+            return _load_policy_cached(str(path.resolve()), st.st_mtime_ns, st.st_size)
     except Exception:
         pass
     return default_policy()
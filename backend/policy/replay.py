@@ -5,7 +5,7 @@ compare predictions and confidence; produce PASS/FAIL report.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable
 
 from policy.policy_model import Policy
 from policy.policy_runtime import min_confidence_from_policy
@@ -16,14 +16,15 @@ MARKETS_V2 = ["1X2", "OU_2.5", "BTTS"]
 
 
 def run_replay(
-    snapshots: list[dict[str, Any]],
+    snapshots: Iterable[dict[str, Any]],
     current_policy: Policy,
     proposed_policy: Policy,
 ) -> dict[str, Any]:
     """
     Run analyzer twice per snapshot (current vs proposed policy).
     Compare prediction counts and confidence; return replay_report with PASS/FAIL.
-    snapshots: list of { "match_id": str, "evidence_pack": dict } (evidence_pack serialized).
+    snapshots: iterable of { "match_id": str, "evidence_pack": dict } (evidence_pack serialized);
+    consumed once, so a streaming generator works.
     """
     from evaluation.evaluation_v2 import evidence_pack_from_dict
     from analyzer.v2.engine import analyze_v2
@@ -35,8 +36,10 @@ def run_replay(
     proposed_counts: dict[str, int] = {}
     current_confidences: list[float] = []
     proposed_confidences: list[float] = []
+    match_ids: list[Any] = []
 
     for item in snapshots:
+        match_ids.append(item.get("match_id"))
         match_id = item.get("match_id") or "unknown"
         ep_dict = item.get("evidence_pack")
         if not ep_dict:
@@ -66,7 +69,7 @@ def run_replay(
                     proposed_confidences.append(float(c))
 
     # Predictions vs NO_PREDICTION: total PLAY decisions across all snapshots/markets
-    n = len(snapshots)
+    n = len(match_ids)
     current_play = len(current_confidences)
     proposed_play = len(proposed_confidences)
     # Coverage = share of snapshots that got at least one PLAY (we don't have per-snapshot PLAY count here easily)
@@ -79,7 +82,7 @@ def run_replay(
     passed = coverage_drop_pct <= COVERAGE_DROP_THRESHOLD_PCT
 
     # Input checksum for reproducibility
-    snapshots_checksum = checksum_report({"snapshots_count": len(snapshots), "match_ids": [s.get("match_id") for s in snapshots]})
+    snapshots_checksum = checksum_report({"snapshots_count": n, "match_ids": match_ids})
 
     report = {
         "replay_result": "PASS" if passed else "FAIL",
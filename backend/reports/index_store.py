@@ -10,18 +10,32 @@ from pathlib import Path
 from typing import Any, Dict, List
 
 
+QUALITY_AUDIT_JSONL_SUFFIX = ".qa.jsonl"
+
+
 def _stable_dumps(obj: Any) -> str:
     return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
 
 
+def quality_audit_jsonl_path(index_path: str | Path) -> Path:
+    """Append-only sidecar next to index.json holding quality audit entries not yet compacted into it."""
+    return Path(index_path).with_suffix(QUALITY_AUDIT_JSONL_SUFFIX)
+
+
 def load_index(path: str | Path = "reports/index.json") -> Dict[str, Any]:
     """
     Load index from path. Returns dict with keys: runs (list), latest_run_id (str or None),
     live_shadow_runs (list), latest_live_shadow_run_id (str or None),
     live_shadow_analyze_runs (list), latest_live_shadow_analyze_run_id (str or None).
+    Pending quality audit entries from the JSONL sidecar are merged into quality_audit_runs.
     If file does not exist or is invalid JSON, returns empty index (no crash).
     """
-    path = Path(path)
+    index = _read_index_file(Path(path))
+    _merge_quality_audit_lines(index, _read_jsonl(quality_audit_jsonl_path(path)))
+    return index
+
+
+def _read_index_file(path: Path) -> Dict[str, Any]:
     if not path.exists():
         return {
             "runs": [],
@@ -254,24 +268,98 @@ def append_provider_parity_run(index: Dict[str, Any], run_meta: Dict[str, Any])
     return index
 
 
+def _quality_audit_entry(run_meta: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "run_id": run_meta.get("run_id"),
+        "created_at_utc": run_meta.get("created_at_utc"),
+        "run_count": run_meta.get("run_count"),
+        "summary": run_meta.get("summary"),
+    }
+
+
 def append_quality_audit_run(index: Dict[str, Any], run_meta: Dict[str, Any]) -> Dict[str, Any]:
     """
     Append a quality audit run. run_meta: run_id, created_at_utc, run_count, summary (dict).
     Sets latest_quality_audit_run_id. Returns updated index.
     """
     runs: List[Dict[str, Any]] = index.get("quality_audit_runs") or []
-    entry = {
-        "run_id": run_meta.get("run_id"),
-        "created_at_utc": run_meta.get("created_at_utc"),
-        "run_count": run_meta.get("run_count"),
-        "summary": run_meta.get("summary"),
-    }
-    runs.append(entry)
+    runs.append(_quality_audit_entry(run_meta))
     index["quality_audit_runs"] = runs
     index["latest_quality_audit_run_id"] = run_meta.get("run_id")
     return index
 
 
+def append_quality_audit_run_jsonl(index_path: str | Path, run_meta: Dict[str, Any]) -> Path:
+    """
+    Append a quality audit run to the index's JSONL sidecar as one line, without reading or rewriting
+    index.json. load_index merges pending lines; compact_quality_audit_runs folds them in. Returns sidecar path.
+    """
+    path = quality_audit_jsonl_path(index_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    line = (_stable_dumps(_quality_audit_entry(run_meta)) + "\n").encode("utf-8")
+    with open(path, "ab") as f:
+        f.write(line)
+    return path
+
+
+def compact_quality_audit_runs(index_path: str | Path) -> int:
+    """
+    Fold pending sidecar entries into index.json and remove the sidecar. The sidecar is renamed first,
+    so runs appending concurrently start a fresh one instead of losing lines. Returns entries folded.
+    """
+    index_path = Path(index_path)
+    path = quality_audit_jsonl_path(index_path)
+    pending = path.with_name(path.name + ".compacting")
+    # A leftover from an interrupted compaction is folded first; the live sidecar waits for the next call
+    if not pending.exists():
+        try:
+            path.replace(pending)
+        except FileNotFoundError:
+            return 0
+    index = load_index(index_path)
+    count = _merge_quality_audit_lines(index, _read_jsonl(pending))
+    save_index(index, index_path)
+    pending.unlink()
+    return count
+
+
+def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    """Parse a JSONL file, skipping blank or malformed lines (e.g. a torn final write). Missing file -> []."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return []
+    entries: List[Dict[str, Any]] = []
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(entry, dict):
+            entries.append(entry)
+    return entries
+
+
+def _merge_quality_audit_lines(index: Dict[str, Any], entries: List[Dict[str, Any]]) -> int:
+    """Append sidecar entries whose run_id is not already listed (index.json may hold them after a save)."""
+    if not entries:
+        return 0
+    runs: List[Dict[str, Any]] = index.get("quality_audit_runs") or []
+    seen = {r.get("run_id") for r in runs if isinstance(r, dict)}
+    count = 0
+    for entry in entries:
+        if entry.get("run_id") in seen:
+            continue
+        runs.append(entry)
+        seen.add(entry.get("run_id"))
+        index["latest_quality_audit_run_id"] = entry.get("run_id")
+        count += 1
+    index["quality_audit_runs"] = runs
+    return count
+
+
 def append_burn_in_ops_run(index: Dict[str, Any], run_meta: Dict[str, Any]) -> Dict[str, Any]:
     """
     Append a burn-in ops run (consolidated bundle). run_meta: run_id, created_at_utc,
@@ -9,6 +9,9 @@ from models.base import Base
 
 T = TypeVar("T", bound=Base)
 
+# Max ids bound per IN (...) clause; keeps batch lookups under SQLite/Postgres parameter limits
+IN_CLAUSE_CHUNK = 500
+
 
 class BaseRepository(Generic[T]):
     """Base repository with common CRUD helpers.
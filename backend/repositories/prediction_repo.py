@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Sequence
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.prediction import Prediction
-from .base import BaseRepository
+from .base import IN_CLAUSE_CHUNK, BaseRepository
 
 
 class PredictionRepository(BaseRepository[Prediction]):
@@ -41,3 +41,19 @@ class PredictionRepository(BaseRepository[Prediction]):
         )
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
+
+    async def list_by_analysis_run_ids(
+        self, analysis_run_ids: Sequence[int]
+    ) -> List[Prediction]:
+        """List predictions for several analysis runs (one IN query per chunk of ids)."""
+        out: List[Prediction] = []
+        for i in range(0, len(analysis_run_ids), IN_CLAUSE_CHUNK):
+            chunk = analysis_run_ids[i : i + IN_CLAUSE_CHUNK]
+            stmt = (
+                select(Prediction)
+                .where(Prediction.analysis_run_id.in_(chunk))
+                .order_by(Prediction.analysis_run_id, Prediction.created_at_utc, Prediction.id)
+            )
+            result = await self.session.execute(stmt)
+            out.extend(result.scalars().all())
+        return out
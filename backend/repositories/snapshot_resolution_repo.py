@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.snapshot_resolution import SnapshotResolution
-from .base import BaseRepository
+from .base import IN_CLAUSE_CHUNK, BaseRepository
 
 
 class SnapshotResolutionRepository(BaseRepository[SnapshotResolution]):
@@ -30,6 +30,20 @@ class SnapshotResolutionRepository(BaseRepository[SnapshotResolution]):
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
+    async def list_by_analysis_run_ids(self, analysis_run_ids: Sequence[int]) -> List[SnapshotResolution]:
+        """Resolutions for the given analysis runs (ordered by id), one IN query per chunk of ids."""
+        out: List[SnapshotResolution] = []
+        for i in range(0, len(analysis_run_ids), IN_CLAUSE_CHUNK):
+            chunk = analysis_run_ids[i : i + IN_CLAUSE_CHUNK]
+            stmt = (
+                select(SnapshotResolution)
+                .where(SnapshotResolution.analysis_run_id.in_(chunk))
+                .order_by(SnapshotResolution.id)
+            )
+            result = await self.session.execute(stmt)
+            out.extend(result.scalars().all())
+        return out
+
     async def list_by_created_between(
         self,
         from_utc: Optional[datetime] = None,
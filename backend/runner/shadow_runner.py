@@ -5,11 +5,12 @@ and produces an offline BatchReport. No UI changes, no policy apply, no schedule
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncContextManager, Callable, Dict, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -57,6 +58,8 @@ async def run_shadow_batch(
     dry_run: Optional[bool] = None,
     activation: bool = False,
     index_path: Optional[str | Path] = None,
+    max_workers: int = 1,
+    session_factory: Optional[Callable[[], AsyncContextManager[AsyncSession]]] = None,
 ) -> Dict[str, Any]:
     """
     Run shadow pipeline for each match and collect a BatchReport.
@@ -65,6 +68,9 @@ async def run_shadow_batch(
     dry_run: if True, do not persist or write cache; if None, defaults to read-only (not live_writes_allowed()).
     activation: if True, check activation gate and persist if allowed (still requires env gates).
     index_path: optional path to reports/index for daily cap and rollout (no DB).
+    max_workers: with session_factory (e.g. get_database_manager().session), run up to this many matches
+    concurrently, each in its own session. Ignored with activation (daily cap is consumed in match order).
+    Results are still aggregated in sorted match_id order, so the report shape and checksums are unchanged.
     """
     if dry_run is None:
         dry_run = not live_writes_allowed()
@@ -132,25 +138,46 @@ async def run_shadow_batch(
     activations_used_this_batch = 0
     daily_rem = daily_cap_remaining_now
 
-    for match_id in match_ids:
+    async def _run_match(match_session: AsyncSession, match_id: str, allow_this_match: bool) -> Dict[str, Any]:
+        return await run_shadow_pipeline(
+            match_session,
+            connector_name=connector_name,
+            match_id=match_id,
+            final_score=final_scores.get(match_id) or _placeholder_final_score(match_id),
+            status="FINAL",
+            now_utc=now,
+            dry_run=dry_run,
+            activation=activation,
+            allow_activation_for_this_match=allow_this_match if activation else None,
+        )
+
+    # Concurrent path: pipelines fan out over pooled sessions; outcomes are consumed below in match order
+    prefetched: Optional[List[Any]] = None
+    if max_workers > 1 and session_factory is not None and not activation and len(match_ids) > 1:
+        sem = asyncio.Semaphore(max_workers)
+
+        async def _run_isolated(match_id: str) -> Any:
+            try:
+                async with sem, session_factory() as match_session:
+                    return await _run_match(match_session, match_id, False)
+            except Exception as e:  # noqa: BLE001
+                return e
+
+        prefetched = await asyncio.gather(*(_run_isolated(m) for m in match_ids))
+
+    for i, match_id in enumerate(match_ids):
         allow_this_match = False
         if activation and batch_activation_allowed:
             allow_this_match = (match_id in rollout_set) and (daily_rem > 0)
-        score = final_scores.get(match_id) or _placeholder_final_score(match_id)
-        try:
-            report = await run_shadow_pipeline(
-                session,
-                connector_name=connector_name,
-                match_id=match_id,
-                final_score=score,
-                status="FINAL",
-                now_utc=now,
-                dry_run=dry_run,
-                activation=activation,
-                allow_activation_for_this_match=allow_this_match if activation else None,
-            )
-        except Exception as e:  # noqa: BLE001
-            failures.append({"match_id": match_id, "error": str(e)})
+        if prefetched is not None:
+            report = prefetched[i]
+        else:
+            try:
+                report = await _run_match(session, match_id, allow_this_match)
+            except Exception as e:  # noqa: BLE001
+                report = e
+        if isinstance(report, Exception):
+            failures.append({"match_id": match_id, "error": str(report)})
             continue
 
         if report.get("error"):
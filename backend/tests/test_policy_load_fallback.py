@@ -67,3 +67,26 @@ def test_default_policy_has_expected_structure():
     for m in p.markets.values():
         assert 0.0 <= m.min_confidence <= 1.0
         assert m.min_confidence == 0.62
+
+
+def test_active_policy_cache_invalidated_on_rewrite(tmp_path):
+    """Same file is parsed once; rewriting it (new mtime/size) is picked up."""
+    from policy.policy_runtime import get_active_policy
+    from policy.policy_store import default_policy, save_policy
+
+    policy_path = tmp_path / "policy.json"
+    p = default_policy()
+    save_policy(p, policy_path)
+    orig = os.environ.get("POLICY_PATH")
+    try:
+        os.environ["POLICY_PATH"] = str(policy_path)
+        first = get_active_policy()
+        assert get_active_policy() is first
+        p.meta.version = "v1-rewritten"
+        save_policy(p, policy_path)
+        assert get_active_policy().meta.version == "v1-rewritten"
+    finally:
+        if orig is not None:
+            os.environ["POLICY_PATH"] = orig
+        else:
+            os.environ.pop("POLICY_PATH", None)
@@ -0,0 +1,80 @@
+"""Prediction repo: batched lookup by analysis run ids."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+_backend = Path(__file__).resolve().parent.parent
+if str(_backend) not in sys.path:
+    sys.path.insert(0, str(_backend))
+
+import pytest
+
+import models  # noqa: F401 — register tables with Base.metadata
+from core.database import init_database, dispose_database, get_database_manager
+from models.analysis_run import AnalysisRun
+from models.base import Base
+from models.competition import Competition
+from models.match import Match
+from models.prediction import Prediction
+from models.season import Season
+from models.team import Team
+from repositories.base import IN_CLAUSE_CHUNK
+from repositories.prediction_repo import PredictionRepository
+
+
+@pytest.fixture
+def test_db():
+    """In-memory SQLite with all tables."""
+    async def _setup():
+        await init_database("sqlite+aiosqlite:///:memory:")
+        engine = get_database_manager().engine
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def _teardown():
+        await dispose_database()
+
+    asyncio.run(_setup())
+    yield
+    asyncio.run(_teardown())
+
+
+@pytest.mark.asyncio
+async def test_list_by_analysis_run_ids_spans_chunks(test_db):
+    """More ids than one IN chunk: all predictions come back in run order; runs without predictions are skipped."""
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    run_count = IN_CLAUSE_CHUNK + 2
+    async with get_database_manager().session() as session:
+        session.add(Competition(id="c1", name="League", country="XX", tier=1, is_active=True))
+        session.add(Season(id="s1", competition_id="c1", name="2025", year_start=2025, year_end=2026, is_active=True))
+        session.add(Team(id="t1", name="Home", country="XX", is_active=True))
+        session.add(Team(id="t2", name="Away", country="XX", is_active=True))
+        await session.flush()
+        session.add(Match(
+            id="m1", competition_id="c1", season_id="s1", kickoff_utc=now,
+            status="FINAL", home_team_id="t1", away_team_id="t2",
+        ))
+        for i in range(1, run_count + 1):
+            session.add(AnalysisRun(
+                id=i, created_at_utc=now, logic_version="v", mode="m",
+                data_quality_score=1.0, flags_json="[]",
+            ))
+        await session.flush()
+        # Runs on both sides of the chunk boundary; run_count - 1 has two predictions
+        for run_id in (1, IN_CLAUSE_CHUNK, run_count - 1, run_count - 1):
+            session.add(Prediction(
+                created_at_utc=now, analysis_run_id=run_id, match_id="m1", market="1X2",
+                decision="PLAY", pick="home", probabilities_json="{}", separation=0.1,
+                confidence=0.6, risk=0.2, reasons_json="[]", evidence_pack_json="{}",
+            ))
+
+    async with get_database_manager().session() as session:
+        repo = PredictionRepository(session)
+        rows = await repo.list_by_analysis_run_ids(list(range(1, run_count + 1)) + [99999])
+        assert [r.analysis_run_id for r in rows] == [1, IN_CLAUSE_CHUNK, run_count - 1, run_count - 1]
+        assert await repo.list_by_analysis_run_ids([]) == []
+        assert await repo.list_by_analysis_run_ids([2, 3, 99999]) == []
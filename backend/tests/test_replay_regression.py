@@ -91,3 +91,29 @@ def test_replay_fail_when_coverage_drops_more_than_threshold():
     # proposed (0.95) yields fewer or zero PLAY => coverage drop > 10% => FAIL
     assert "replay_result" in report
     assert report["guardrails"]["passed"] == (report["replay_result"] == "PASS")
+
+
+def test_load_snapshots_list_or_single_object(tmp_path: Path) -> None:
+    """CLI loader yields every item of a JSON list, or the lone object; output feeds run_replay."""
+    import json
+
+    _tools = _backend.parent / "tools"
+    if str(_tools) not in sys.path:
+        sys.path.insert(0, str(_tools))
+    from replay_regression import load_snapshots
+    from policy.policy_runtime import get_active_policy
+    from policy.replay import run_replay
+
+    items = [{"match_id": f"m{i}", "evidence_pack": _minimal_evidence_pack_dict(f"m{i}")} for i in range(3)]
+    list_path = tmp_path / "list.json"
+    list_path.write_text("\n  " + json.dumps(items), encoding="utf-8")
+    single_path = tmp_path / "single.json"
+    single_path.write_text(json.dumps(items[0]), encoding="utf-8")
+
+    assert list(load_snapshots(list_path)) == items
+    assert list(load_snapshots(single_path)) == [items[0]]
+
+    policy = get_active_policy()
+    streamed = run_replay(load_snapshots(list_path), policy, policy)
+    assert streamed == run_replay(items, policy, policy)
+    assert streamed["snapshots_count"] == 3
@@ -16,8 +16,11 @@ import pytest
 
 from reports.index_store import (
     append_burn_in_run,
+    append_quality_audit_run_jsonl,
+    compact_quality_audit_runs,
     load_index,
     append_run,
+    quality_audit_jsonl_path,
     save_index,
 )
 
@@ -107,3 +110,42 @@ def test_append_burn_in_run_updates_burn_in_runs(tmp_path: Path) -> None:
     assert index["latest_burn_in_run_id"] == "shadow_batch_20250601_120000_abc12345"
     assert len(index["burn_in_runs"]) == 1
     assert index["burn_in_runs"][0]["burn_in_summary"]["activated_matches"] == ["m1"]
+
+
+def test_quality_audit_jsonl_entries_visible_via_load_index(tmp_path: Path) -> None:
+    index_path = tmp_path / "index.json"
+    for i in (1, 2):
+        append_quality_audit_run_jsonl(index_path, {
+            "run_id": f"quality_audit_{i}",
+            "created_at_utc": "2025-06-01T12:00:00+00:00",
+            "run_count": i,
+            "summary": {"run_count": i},
+        })
+    assert not index_path.exists()
+    assert quality_audit_jsonl_path(index_path).name == "index.qa.jsonl"
+
+    index = load_index(index_path)
+    assert [r["run_id"] for r in index["quality_audit_runs"]] == ["quality_audit_1", "quality_audit_2"]
+    assert index["latest_quality_audit_run_id"] == "quality_audit_2"
+
+    # A save by another writer persists merged entries; reloading must not duplicate them
+    save_index(index, index_path)
+    assert len(load_index(index_path)["quality_audit_runs"]) == 2
+
+
+def test_compact_quality_audit_runs_folds_sidecar_into_index(tmp_path: Path) -> None:
+    index_path = tmp_path / "index.json"
+    index = load_index(index_path)
+    append_run(index, {"run_id": "shadow_batch_1", "created_at_utc": "2025-06-01T12:00:00+00:00"})
+    save_index(index, index_path)
+    append_quality_audit_run_jsonl(index_path, {"run_id": "quality_audit_1", "run_count": 3, "summary": {}})
+    with open(quality_audit_jsonl_path(index_path), "ab") as f:
+        f.write(b'{"run_id": "torn')  # partial final line is skipped
+
+    assert compact_quality_audit_runs(index_path) == 1
+    assert not quality_audit_jsonl_path(index_path).exists()
+    data = json.loads(index_path.read_text(encoding="utf-8"))
+    assert data["runs"][0]["run_id"] == "shadow_batch_1"
+    assert data["quality_audit_runs"][0]["run_id"] == "quality_audit_1"
+    assert data["latest_quality_audit_run_id"] == "quality_audit_1"
+    assert compact_quality_audit_runs(index_path) == 0
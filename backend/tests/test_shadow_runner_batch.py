@@ -138,3 +138,39 @@ async def test_cap_enforced(test_db):
     assert report.get("aggregates") is None
     assert report.get("checksums") is None
     assert report.get("failures") == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batch_bounded_and_ordered(test_db, monkeypatch):
+    """max_workers fans matches out over per-match sessions (bounded) and keeps per_match in match order."""
+    import runner.shadow_runner as shadow_runner_mod
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_pipeline(session, *, match_id, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if match_id == "c-3":
+            raise RuntimeError("boom")
+        return {"evaluation_report_checksum": f"e-{match_id}", "proposal": {}, "audit": {"changed_count": 1}}
+
+    monkeypatch.setattr(shadow_runner_mod, "run_shadow_pipeline", fake_pipeline)
+    match_ids = ["c-5", "c-1", "c-4", "c-3", "c-2"]
+
+    async with get_database_manager().session() as session:
+        report = await run_shadow_batch(
+            session,
+            connector_name="dummy",
+            match_ids=match_ids,
+            max_workers=2,
+            session_factory=get_database_manager().session,
+        )
+
+    assert peak == 2
+    assert [p["match_id"] for p in report["per_match"]] == ["c-1", "c-2", "c-4", "c-5"]
+    assert report["failures"] == [{"match_id": "c-3", "error": "boom"}]
+    assert report["aggregates"]["total_changed_decisions"] == 4
@@ -0,0 +1,65 @@
+"""Snapshot resolution repo: batched lookup by analysis run ids."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+_backend = Path(__file__).resolve().parent.parent
+if str(_backend) not in sys.path:
+    sys.path.insert(0, str(_backend))
+
+import pytest
+
+import models  # noqa: F401 — register tables with Base.metadata
+from core.database import init_database, dispose_database, get_database_manager
+from models.analysis_run import AnalysisRun
+from models.base import Base
+from models.snapshot_resolution import SnapshotResolution
+from repositories import snapshot_resolution_repo
+from repositories.snapshot_resolution_repo import SnapshotResolutionRepository
+
+
+@pytest.fixture
+def test_db():
+    """In-memory SQLite with all tables."""
+    async def _setup():
+        await init_database("sqlite+aiosqlite:///:memory:")
+        engine = get_database_manager().engine
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def _teardown():
+        await dispose_database()
+
+    asyncio.run(_setup())
+    yield
+    asyncio.run(_teardown())
+
+
+@pytest.mark.asyncio
+async def test_list_by_analysis_run_ids_spans_chunks(test_db, monkeypatch):
+    """Ids split across several IN chunks are all returned; unknown ids are ignored."""
+    monkeypatch.setattr(snapshot_resolution_repo, "IN_CLAUSE_CHUNK", 2)
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    async with get_database_manager().session() as session:
+        for i in range(1, 6):
+            session.add(AnalysisRun(
+                id=i, created_at_utc=now, logic_version="v", mode="m",
+                data_quality_score=1.0, flags_json="[]",
+            ))
+        await session.flush()
+        for i in (1, 3, 4, 5):
+            session.add(SnapshotResolution(
+                created_at_utc=now, analysis_run_id=i, match_id=f"m{i}",
+                final_home_goals=1, final_away_goals=0, status="FINAL",
+                market_outcomes_json="{}", reason_codes_by_market_json="{}",
+            ))
+
+    async with get_database_manager().session() as session:
+        repo = SnapshotResolutionRepository(session)
+        rows = await repo.list_by_analysis_run_ids([1, 2, 3, 4, 5, 99])
+        assert sorted(r.analysis_run_id for r in rows) == [1, 3, 4, 5]
+        assert await repo.list_by_analysis_run_ids([]) == []
@@ -4,6 +4,7 @@ Unit tests for burn-in summary extractor formatting.
 
 from __future__ import annotations
 
+import json
 import sys
 from pathlib import Path
 
@@ -18,7 +19,7 @@ if str(_tools) not in sys.path:
 
 import pytest
 
-from burn_in_summary import format_burn_in_summary
+from burn_in_summary import _extract_live_analyze, format_burn_in_summary
 
 
 def test_format_burn_in_summary_contains_run_status_alerts_activated() -> None:
@@ -87,3 +88,50 @@ def test_format_burn_in_summary_confidence_when_present() -> None:
     assert "Confidence:" in out
     assert "avg=" in out
     assert "count=2" in out or "count=2" in out
+
+
+def test_format_burn_in_summary_confidence_percentiles() -> None:
+    """Confidence line includes p50/p95; non-numeric confidences are skipped."""
+    bundle = {
+        "summary": {"run_id": "r1", "status": "ok", "alerts_count": 0, "activated": False, "matches_count": 2, "connector_name": "c1"},
+        "live_analyze": {
+            "live_analysis_reports": {
+                "m1": {"analyzer": {"decisions": [{"confidence": 0.50}, {"confidence": 0.60}, {"confidence": "bad"}]}},
+                "m2": {"decisions": [{"confidence": 0.70}, {"confidence": None}]},
+            },
+        },
+    }
+    out = format_burn_in_summary(bundle)
+    assert "avg=0.60" in out
+    assert "p50=0.60" in out
+    assert "p95=0.69" in out
+    assert "count=3" in out
+
+
+def test_extract_live_analyze_matches_full_parse(tmp_path: Path) -> None:
+    """Streamed live_analyze extraction prunes to summary inputs and yields the same text as a full json.loads."""
+    pytest.importorskip("ijson")
+    live_analyze = {
+        "alerts": [{"code": "LATENCY", "message": "slow"}],
+        "summary": {"latency_ms": 42.0},
+        "live_analysis_reports": {
+            "m1": {"analyzer": {"decisions": [{"market": "1X2", "confidence": 0.61, "evidence": {"big": list(range(50))}}]}},
+            "m2": {"decisions": [{"market": "BTTS", "confidence": 0.72}]},
+        },
+        "unused_payload": {"rows": [{"x": i} for i in range(100)]},
+    }
+    p = tmp_path / "live_analyze.json"
+    p.write_text(json.dumps(live_analyze), encoding="utf-8")
+    summary = {"run_id": "r1", "status": "ok", "alerts_count": 1, "activated": False, "matches_count": 2, "connector_name": "c1"}
+    extracted = _extract_live_analyze(p)
+    assert extracted == {
+        "alerts": [{"code": "LATENCY", "message": "slow"}],
+        "summary": {"latency_ms": 42.0},
+        "live_analysis_reports": {
+            "m1": {"decisions": [{"confidence": 0.61}]},
+            "m2": {"decisions": [{"confidence": 0.72}]},
+        },
+    }
+    assert format_burn_in_summary({"summary": summary, "live_analyze": extracted}) == format_burn_in_summary(
+        {"summary": summary, "live_analyze": live_analyze}
+    )
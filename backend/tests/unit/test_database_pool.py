@@ -0,0 +1,30 @@
+"""
+Tests for init_database pool sizing: CLI pool arguments must not break SQLite engines.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+_backend = Path(__file__).resolve().parent.parent.parent
+if str(_backend) not in sys.path:
+    sys.path.insert(0, str(_backend))
+
+import pytest
+from sqlalchemy import text
+
+from core.database import dispose_database, get_database_manager, init_database
+
+
+@pytest.mark.asyncio
+async def test_init_database_file_sqlite_accepts_cli_pool_args(tmp_path: Path) -> None:
+    """File-backed SQLite (NullPool) opens with pool_size/max_overflow as the tools pass them."""
+    db_path = tmp_path / "pool.db"
+    await init_database(f"sqlite+aiosqlite:///{db_path.as_posix()}", pool_size=1, max_overflow=0)
+    try:
+        async with get_database_manager().session() as session:
+            assert (await session.execute(text("SELECT 1"))).scalar_one() == 1
+    finally:
+        await dispose_database()
+    assert db_path.exists()
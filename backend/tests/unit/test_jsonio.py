@@ -0,0 +1,60 @@
+"""
+Unit tests for tools/_jsonio: orjson and stdlib report serialization produce the same bytes.
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+_backend = Path(__file__).resolve().parent.parent.parent
+if str(_backend) not in sys.path:
+    sys.path.insert(0, str(_backend))
+
+# Import from tools (repo root)
+_tools = _backend.parent / "tools"
+if str(_tools) not in sys.path:
+    sys.path.insert(0, str(_tools))
+
+import pytest
+
+import _jsonio
+
+
+def test_stable_json_bytes_orjson_matches_stdlib_on_non_ascii(monkeypatch) -> None:
+    """Non-ASCII text, int keys and datetimes serialize identically with and without orjson."""
+    pytest.importorskip("orjson")
+    payload = {
+        "team": "Ολυμπιακός – São Paulo",
+        "b": {2: "x", 1: "y"},
+        "created": datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc),
+        "a": [1, 0.5, None, True],
+    }
+    fast = _jsonio.stable_json_bytes(payload)
+    monkeypatch.setattr(_jsonio, "orjson", None)
+    slow = _jsonio.stable_json_bytes(payload)
+    assert fast == slow
+    assert "Ολυμπιακός".encode("utf-8") in slow
+
+
+def test_json_bytes_handles_datetimes_and_int_keys(monkeypatch) -> None:
+    """Unsorted report output accepts datetimes and int keys on both backends, compact and pretty."""
+    pytest.importorskip("orjson")
+    payload = {"z": datetime(2025, 1, 1, tzinfo=timezone.utc), "rows": {1: "a"}, "a": "ü"}
+    fast = (_jsonio.json_bytes(payload), _jsonio.json_bytes(payload, pretty=True))
+    monkeypatch.setattr(_jsonio, "orjson", None)
+    slow = (_jsonio.json_bytes(payload), _jsonio.json_bytes(payload, pretty=True))
+    assert fast == slow
+    assert slow[0] == '{"z":"2025-01-01 00:00:00+00:00","rows":{"1":"a"},"a":"ü"}'.encode("utf-8")
+
+
+def test_stable_json_bytes_sorts_non_str_keys_as_strings(monkeypatch) -> None:
+    """Int keys >= 10 and mixed str/int keys sort as strings on both backends."""
+    pytest.importorskip("orjson")
+    payload = {"counts": {10: 1, 2: 2}, "mixed": {"b": 1, 3: 2, "a": 3}, "rows": [{11: "x", 9: "y"}]}
+    fast = _jsonio.stable_json_bytes(payload)
+    monkeypatch.setattr(_jsonio, "orjson", None)
+    slow = _jsonio.stable_json_bytes(payload)
+    assert fast == slow
+    assert slow == b'{"counts":{"10":1,"2":2},"mixed":{"3":2,"a":3,"b":1},"rows":[{"11":"x","9":"y"}]}'
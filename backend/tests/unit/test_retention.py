@@ -125,3 +125,22 @@ def test_retention_keep_last_n_deterministic(tmp_path: Path) -> None:
     assert not (reports_dir / "burn_in" / "run_002").exists()
     assert (reports_dir / "burn_in" / "run_003").exists()
     assert (reports_dir / "burn_in" / "run_004").exists()
+
+
+def test_retention_prunes_file_artifacts(tmp_path: Path) -> None:
+    """Per-run JSON artifacts (live_shadow_compare/<run_id>.json) are pruned; unrelated files are left alone."""
+    reports_dir = tmp_path / "reports"
+    compare_dir = reports_dir / "live_shadow_compare"
+    compare_dir.mkdir(parents=True)
+    index_path = reports_dir / "index.json"
+    index = load_index(index_path)
+    for i in range(3):
+        append_burn_in_ops_run(index, {"run_id": f"run_{i}", "created_at_utc": "2025-01-01T12:00:00Z", "connector_name": "dummy", "matches_count": 0, "status": "ok", "alerts_count": 0, "activated": False})
+        (compare_dir / f"run_{i}.json").write_text("{}")
+    save_index(index, index_path)
+    (compare_dir / "notes.txt").write_text("keep")
+
+    _, deleted_paths, errs = cleanup_reports(str(reports_dir), keep_last_n=1, dry_run=False, index_path=index_path)
+    assert errs == 0
+    assert sorted(Path(p).name for p in deleted_paths) == ["run_0.json", "run_1.json"]
+    assert sorted(p.name for p in compare_dir.iterdir()) == ["notes.txt", "run_2.json"]
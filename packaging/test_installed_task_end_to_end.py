@@ -50,8 +50,16 @@ def _log_dir() -> Path:
     return Path(os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))) / "AI_Mentor" / "logs"
 
 
+def _nsis_dir(repo_root: Path) -> Path:
+    """NSIS bundle dir: under $CARGO_TARGET_DIR when the build pinned it, else the in-tree Tauri target."""
+    cargo_target = os.environ.get("CARGO_TARGET_DIR", "")
+    if cargo_target:
+        return Path(cargo_target) / "release" / "bundle" / "nsis"
+    return repo_root / NSIS_SUBDIR
+
+
 def _find_latest_installer(repo_root: Path) -> Path | None:
-    nsis_dir = repo_root / NSIS_SUBDIR
+    nsis_dir = _nsis_dir(repo_root)
     if not nsis_dir.is_dir():
         return None
     exes = list(nsis_dir.glob("*.exe"))
@@ -146,7 +154,7 @@ def _run_e2e(repo_root: Path) -> int:
     """Run E2E steps; all print() is teed to e2e_stdout.txt by main()."""
     installer = _find_latest_installer(repo_root)
     if not installer:
-        print(f"FAIL: No NSIS installer under {repo_root / NSIS_SUBDIR}")
+        print(f"FAIL: No NSIS installer under {_nsis_dir(repo_root)}")
         return 1
     print(f"Installer path: {installer}")
 
@@ -8,20 +8,30 @@ launch_backend.cmd and task XML to Tauri bin, builds NSIS; FINAL step runs test_
 Run from repo root:
   python -m tooling.launchers.build_desktop_windows
 Or: python tooling/launchers/build_desktop_windows.py (with cwd = repo root).
+Pass --force to rebuild the frontend even when its sources match .build_cache/frontend.sha256.
 """
 from __future__ import annotations
 
+import argparse
+import asyncio
+import hashlib
 import os
 import shutil
+import socket
 import subprocess
 import sys
 import time
+import urllib.request
 from datetime import datetime, timezone
 from pathlib import Path
 
 # Repo root from this file (Unicode-safe; no reliance on cwd or argv)
 _SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = _SCRIPT_DIR.parent.parent
+TAURI_BUILD_TIMEOUT_S = 600
+# Frontend inputs: a digest match with the last successful build lets lint/tsc/vite be skipped
+FRONTEND_SRC_SUFFIXES = (".ts", ".tsx", ".js", ".jsx", ".css", ".json")
+FRONTEND_ROOT_FILES = ("package.json", "package-lock.json", "index.html", "vite.config.ts", "tsconfig.json", "tsconfig.app.json")
 
 
 def _short_path(path: Path) -> str:
@@ -39,7 +49,7 @@ def _short_path(path: Path) -> str:
     return str(path)
 
 
-def _run(cmd: list[str], cwd: Path, env: dict | None = None, desc: str = "", shell: bool = False) -> None:
+async def _run_async(cmd: list[str], cwd: Path, env: dict | None = None, desc: str = "", shell: bool = False) -> None:
     env = env or os.environ
     env = {str(k): str(v) for k, v in env.items()}
     cwd_str = _short_path(cwd)
@@ -55,48 +65,104 @@ def _run(cmd: list[str], cwd: Path, env: dict | None = None, desc: str = "", she
         # Pass as a single string for cmd.exe
         cmd_line = " ".join(cmd_str)
         print(f"  run: {cmd_line}")
-        subprocess.run(cmd_line, cwd=cwd_str, env=env, check=True, shell=True)
+        proc = await asyncio.create_subprocess_shell(cmd_line, cwd=cwd_str, env=env)
     else:
         print(f"  run: {' '.join(cmd_str)}")
-        subprocess.run(cmd_str, cwd=cwd_str, env=env, check=True, shell=shell)
+        proc = await asyncio.create_subprocess_exec(*cmd_str, cwd=cwd_str, env=env)
+    try:
+        rc = await proc.wait()
+    except asyncio.CancelledError:
+        # Timeout or sibling failure: do not leave the child (e.g. cargo) running
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+        await proc.wait()
+        raise
+    if rc:
+        raise subprocess.CalledProcessError(rc, cmd_str)
 
 
-def _ensure_node_npm_on_path(env: dict) -> None:
-    """On Windows, if npm is not on PATH, add common Node.js locations or find via where.exe."""
+def _node_npm_dirs(path: str) -> list[Path]:
+    """On Windows, Node.js/npm dirs to prepend when PATH lacks them (common locations, then where.exe)."""
     if sys.platform != "win32":
-        return
-    path = env.get("PATH", "")
-    if "npm" in path.lower() or "nodejs" in path.lower():
-        return
-    candidates = [
-        Path(os.environ.get("ProgramFiles", "C:\\Program Files")) / "nodejs",
-        Path(os.environ.get("ProgramFiles(x86)", "")) / "nodejs",
-        Path(os.environ.get("APPDATA", "")) / "npm",
-        Path(os.environ.get("LOCALAPPDATA", "")) / "Programs" / "node",
-    ]
-    for d in candidates:
-        if not d:
-            continue
-        npm = d / "npm.cmd" if (d / "npm.cmd").exists() else (d / "npm")
-        if d.exists() and (npm.exists() or (d / "node.exe").exists()):
-            env["PATH"] = str(d) + os.pathsep + path
-            return
-    try:
-        r = subprocess.run(
-            ["where.exe", "npm"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            env=env,
-            cwd=os.getcwd(),
-        )
-        if r.returncode == 0 and r.stdout:
-            first_line = r.stdout.strip().splitlines()[0].strip()
-            if first_line:
-                npm_dir = str(Path(first_line).parent)
-                env["PATH"] = npm_dir + os.pathsep + path
-    except Exception:
-        pass
+        return []
+    dirs: list[Path] = []
+    if "npm" not in path.lower() and "nodejs" not in path.lower():
+        candidates = [
+            Path(os.environ.get("ProgramFiles", "C:\\Program Files")) / "nodejs",
+            Path(os.environ.get("ProgramFiles(x86)", "")) / "nodejs",
+            Path(os.environ.get("APPDATA", "")) / "npm",
+            Path(os.environ.get("LOCALAPPDATA", "")) / "Programs" / "node",
+        ]
+        for d in candidates:
+            if not d:
+                continue
+            npm = d / "npm.cmd" if (d / "npm.cmd").exists() else (d / "npm")
+            if d.exists() and (npm.exists() or (d / "node.exe").exists()):
+                dirs.append(d)
+                break
+        else:
+            try:
+                r = subprocess.run(
+                    ["where.exe", "npm"],
+                    capture_output=True,
+                    text=True,
+                    timeout=5,
+                    cwd=os.getcwd(),
+                )
+                if r.returncode == 0 and r.stdout:
+                    first_line = r.stdout.strip().splitlines()[0].strip()
+                    if first_line:
+                        dirs.append(Path(first_line).parent)
+            except Exception:
+                pass
+    nodejs_dir = Path(os.environ.get("ProgramFiles", "C:\\Program Files")) / "nodejs"
+    if nodejs_dir.exists() and "nodejs" not in os.pathsep.join([*map(str, dirs), path]).lower():
+        dirs.insert(0, nodejs_dir)
+    return dirs
+
+
+def _build_env(extra_dirs: list[Path]) -> dict:
+    """Copy os.environ with existing extra_dirs prepended to PATH once, in order, without duplicate entries."""
+    env = os.environ.copy()
+    entries = [str(d) for d in extra_dirs if d.is_dir()]
+    entries += [p for p in env.get("PATH", "").split(os.pathsep) if p]
+    env["PATH"] = os.pathsep.join(dict.fromkeys(entries))
+    return env
+
+
+def _hash_tree(root: Path, suffixes: tuple[str, ...], extra_files: tuple[str, ...] = ()) -> str:
+    """blake2b over relative path + bytes of matching files under root (sorted; skips node_modules/dist)."""
+    h = hashlib.blake2b()
+
+    def _feed(path: str) -> None:
+        h.update(os.path.relpath(path, root).replace(os.sep, "/").encode("utf-8") + b"\0")
+        with open(path, "rb") as f:
+            h.update(f.read())
+        h.update(b"\0")
+
+    def _walk(d: str) -> None:
+        with os.scandir(d) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for e in entries:
+            if e.is_dir(follow_symlinks=False):
+                if e.name not in ("node_modules", "dist"):
+                    _walk(e.path)
+            elif e.name.endswith(suffixes):
+                _feed(e.path)
+
+    for name in extra_files:
+        if (root / name).is_file():
+            _feed(str(root / name))
+    if (root / "src").is_dir():
+        _walk(str(root / "src"))
+    return h.hexdigest()
+
+
+def _iso_now() -> str:
+    """UTC timestamp for log lines (second precision)."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
 def _copy(src: Path, dst: Path) -> None:
@@ -105,6 +171,59 @@ def _copy(src: Path, dst: Path) -> None:
     print(f"  copy: {dst}")
 
 
+def _available_cpus() -> int:
+    """CPUs this process may run on (affinity-aware where the OS supports it)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _safe_parallel() -> bool:
+    """Overlap build stages only with >= 4 cores; on 2-core runners contention outweighs the overlap."""
+    return _available_cpus() >= 4
+
+
+async def _build_backend(root: Path, env: dict) -> Path:
+    """[1/5] pip install + bytecode pre-compile + PyInstaller; return the backend exe path."""
+    print("[1/5] Installing backend deps...")
+    try:
+        await _run_async(
+            [sys.executable, "-m", "pip", "install", "-r", str(root / "backend" / "requirements.txt")],
+            cwd=root,
+            env=env,
+        )
+    except subprocess.CalledProcessError:
+        print("  WARNING: pip install failed. Continuing with existing packages.")
+    # Pre-compile backend sources on all cores so PyInstaller reuses __pycache__ instead of
+    # byte-compiling each module in its single-threaded analysis pass.
+    print("[1/5] Pre-compiling backend bytecode...")
+    try:
+        await _run_async([sys.executable, "-m", "compileall", "-j", "0", "-q", str(root / "backend")], cwd=root, env=env)
+    except subprocess.CalledProcessError:
+        print("  WARNING: compileall reported errors. PyInstaller will compile remaining modules.")
+    print("[1/5] Building backend exe (PyInstaller)...")
+    await _run_async(
+        [
+            sys.executable,
+            "-m",
+            "PyInstaller",
+            str(root / "packaging" / "backend_sidecar" / "pyinstaller_sidecar.spec"),
+            "--noconfirm",
+        ],
+        cwd=root,
+        env=env,
+    )
+    exe_path = root / "dist" / "ai-mentor-backend.exe"
+    print("  Backend EXE:", exe_path)
+    return exe_path
+
+
+async def _npm_install(frontend_dir: Path, env: dict) -> None:
+    print("[3/5] Frontend: npm install...")
+    await _run_async(["npm", "install"], cwd=frontend_dir, env=env, shell=sys.platform == "win32")
+
+
 def run_smoke_test(repo_root: Path) -> None:
     """Launch built backend exe briefly; check backend.log; write build_smoke_test.log."""
     localappdata = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
@@ -115,19 +234,32 @@ def run_smoke_test(repo_root: Path) -> None:
     exe = repo_root / "dist" / "ai-mentor-backend.exe"
     if not exe.exists():
         lines = [
-            f"[{datetime.now(timezone.utc).isoformat()}] build_smoke_test",
+            f"[{_iso_now()}] build_smoke_test",
             "backend_exe_missing=yes",
             "path=" + str(exe),
         ]
         smoke_log.write_text("\n".join(lines) + "\n", encoding="utf-8")
         return
 
-    # Clear or truncate backend.log so we only see this run
+    # Read only what this run appends (no truncation: avoids racing the backend's own log handle)
     backend_log = log_dir / "backend.log"
-    if backend_log.exists():
+    try:
+        start_offset = backend_log.stat().st_size if backend_log.exists() else 0
+    except OSError:
+        start_offset = 0
+    buf = bytearray()
+    pos = start_offset
+
+    def _read_tail() -> None:
+        nonlocal pos
+        if not backend_log.exists():
+            return
         try:
-            backend_log.write_text("", encoding="utf-8")
-        except Exception:
+            with open(backend_log, "rb") as f:
+                f.seek(pos)
+                buf.extend(f.read())
+                pos = f.tell()
+        except OSError:
             pass
 
     env = os.environ.copy()
@@ -140,18 +272,33 @@ def run_smoke_test(repo_root: Path) -> None:
         stderr=subprocess.DEVNULL,
     )
     try:
-        time.sleep(4)
-        content = ""
-        if backend_log.exists():
+        # Readiness = kernel-level TCP accept on 127.0.0.1:8000 (race-free, independent of log format);
+        # backend.log tail is still read for import diagnostics.
+        bound_8000 = False
+        for _ in range(60):
             try:
-                content = backend_log.read_text(encoding="utf-8", errors="replace")
-            except Exception:
-                content = ""
+                with socket.create_connection(("127.0.0.1", 8000), timeout=0.1):
+                    bound_8000 = True
+                    break
+            except OSError:
+                pass
+            if proc.poll() is not None:
+                break
+            _read_tail()
+            time.sleep(0.1)
+        health_ok = False
+        if bound_8000:
+            try:
+                with urllib.request.urlopen("http://127.0.0.1:8000/health", timeout=0.5) as resp:
+                    health_ok = resp.status == 200
+            except (OSError, ValueError):
+                health_ok = False
+        _read_tail()
+        content = buf.decode("utf-8", errors="replace")
         has_module_error = "ModuleNotFoundError" in content or (
             "aiosqlite" in content and "No module named" in content
         )
-        has_start = "BACKEND_START" in content and "127.0.0.1" in content
-        bound_8000 = "8000" in content and "127.0.0.1" in content
+        has_start = bound_8000 or ("BACKEND_START" in content and "127.0.0.1" in content)
     finally:
         try:
             proc.terminate()
@@ -163,61 +310,57 @@ def run_smoke_test(repo_root: Path) -> None:
                 pass
 
     lines = [
-        f"[{datetime.now(timezone.utc).isoformat()}] build_smoke_test",
+        f"[{_iso_now()}] build_smoke_test",
         "backend_started=yes" if has_start else "backend_started=no",
         "backend_bind_127.0.0.1_8000=yes" if bound_8000 else "backend_bind_127.0.0.1_8000=no",
+        "backend_health_200=yes" if health_ok else "backend_health_200=no",
         "no_ModuleNotFoundError=yes" if not has_module_error else "no_ModuleNotFoundError=no",
     ]
     smoke_log.write_text("\n".join(lines) + "\n", encoding="utf-8")
     print("  smoke test log: " + str(smoke_log))
 
 
-def main() -> int:
+async def main_async(force: bool = False) -> int:
     root = REPO_ROOT
     print("=== AI Mentor Desktop Build (Windows) ===")
     print("Repo root:", root)
     print()
 
+    # Ensure Rust/cargo on PATH for pip builds (e.g. pydantic-core on Python 3.14) and Node/npm for
+    # frontend and Tauri (Windows often needs this when run from IDE); PATH is rebuilt once and reused
+    extra_dirs = _node_npm_dirs(os.environ.get("PATH", ""))
+    if sys.platform == "win32":
+        extra_dirs.append(Path(os.environ.get("USERPROFILE", "")) / ".cargo" / "bin")
+    env = _build_env(extra_dirs)
     # Clear TAURI_CONFIG so Tauri uses only src-tauri/tauri.conf.json
-    env = os.environ.copy()
     env.pop("TAURI_CONFIG", None)
-    # Ensure Rust/cargo on PATH for pip builds (e.g. pydantic-core on Python 3.14)
-    cargo_bin = Path(os.environ.get("USERPROFILE", "")) / ".cargo" / "bin"
-    if sys.platform == "win32" and cargo_bin.exists():
-        path = env.get("PATH", "")
-        env["PATH"] = str(cargo_bin) + os.pathsep + path
-    # Ensure Node/npm on PATH for frontend and Tauri (Windows often needs this when run from IDE)
-    _ensure_node_npm_on_path(env)
     if sys.platform == "win32":
-        nodejs_dir = Path(os.environ.get("ProgramFiles", "C:\\Program Files")) / "nodejs"
-        if nodejs_dir.exists() and "nodejs" not in env.get("PATH", "").lower():
-            env["PATH"] = str(nodejs_dir) + os.pathsep + env.get("PATH", "")
         print("  nodejs in PATH:", "nodejs" in env.get("PATH", "").lower())
 
-    # 1) Backend: pip install + PyInstaller (backend exe)
-    print("[1/5] Installing backend deps...")
-    try:
-        _run(
-            [sys.executable, "-m", "pip", "install", "-r", str(root / "backend" / "requirements.txt")],
-            cwd=root,
-            env=env,
-        )
-    except subprocess.CalledProcessError:
-        print("  WARNING: pip install failed. Continuing with existing packages.")
-    print("[1/5] Building backend exe (PyInstaller)...")
-    _run(
-        [
-            sys.executable,
-            "-m",
-            "PyInstaller",
-            str(root / "packaging" / "backend_sidecar" / "pyinstaller_sidecar.spec"),
-            "--noconfirm",
-        ],
-        cwd=root,
-        env=env,
+    # Any non-empty PYTHONDONTWRITEBYTECODE (even "0") disables .pyc writes needed by the pre-compile step
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    # Keep cargo/make one core short of the budget so an overlapping stage is not starved
+    jobs = str(max(1, _available_cpus() - 1))
+    env.setdefault("CARGO_BUILD_JOBS", jobs)
+    env.setdefault("MAKEFLAGS", f"-j{jobs}")
+
+    # Pin cargo's target dir outside the frontend tree so incremental Rust artifacts survive cleans
+    cargo_target = Path(
+        env.get("CARGO_TARGET_DIR")
+        or Path(os.environ.get("LOCALAPPDATA", str(root))) / "AI_Mentor" / "cargo-target"
     )
-    exe_path = root / "dist" / "ai-mentor-backend.exe"
-    print("  Backend EXE:", exe_path)
+    cargo_target.mkdir(parents=True, exist_ok=True)
+    env["CARGO_TARGET_DIR"] = str(cargo_target)
+    if shutil.which("sccache", path=env.get("PATH")):
+        env.setdefault("RUSTC_WRAPPER", "sccache")
+
+    # 1) Backend: pip install + PyInstaller (backend exe); npm install has no dependency on it
+    frontend_dir = root / "app" / "frontend"
+    npm_install = None
+    if _safe_parallel():
+        # Overlap on the event loop; a failure here is surfaced in step 3 where npm errors are handled
+        npm_install = asyncio.create_task(_npm_install(frontend_dir, env))
+    exe_path = await _build_backend(root, env)
 
     # 2) Copy backend exe + task launcher into Tauri bin (for NSIS bundle; no XML)
     print("[2/5] Copying backend exe and launch_backend.cmd to Tauri bin...")
@@ -229,7 +372,6 @@ def main() -> int:
     print()
 
     # 3) Frontend: npm install + build
-    frontend_dir = root / "app" / "frontend"
     tauri_ok = False
     try:
         import json as _json
@@ -241,7 +383,8 @@ def main() -> int:
             except Exception:
                 pass
         try:
-            r = subprocess.run(
+            r = await asyncio.to_thread(
+                subprocess.run,
                 ["git", "rev-parse", "--short", "HEAD"],
                 cwd=root,
                 capture_output=True,
@@ -251,32 +394,61 @@ def main() -> int:
             git_sha = (r.stdout or "").strip() or "nogit"
         except Exception:
             git_sha = "nogit"
-        ts = datetime.utcnow().strftime("%Y%m%d%H%M")
+        ts = time.strftime("%Y%m%d%H%M", time.gmtime())
         build_id = f"{version}-{git_sha}-{ts}"
         env["VITE_BUILD_ID"] = build_id
         print(f"  VITE_BUILD_ID={build_id}")
-        print("[3/5] Frontend: npm install...")
-        _run(["npm", "install"], cwd=frontend_dir, env=env, shell=sys.platform == "win32")
-        # Fast checks before build (Phase 5)
+        if npm_install is not None:
+            await npm_install
+        else:
+            await _npm_install(frontend_dir, env)
+        frontend_cache = root / ".build_cache" / "frontend.sha256"
+        # Keyed on sources + version only: backend-only commits reuse dist/, which keeps the
+        # VITE_BUILD_ID (commit + timestamp) of the build that produced it
+        tree_digest = await asyncio.to_thread(
+            _hash_tree, frontend_dir, FRONTEND_SRC_SUFFIXES, FRONTEND_ROOT_FILES
+        )
+        frontend_digest = f"{tree_digest}:{version}"
+        frontend_unchanged = (
+            not force
+            and (frontend_dir / "dist").is_dir()
+            and frontend_cache.is_file()
+            and frontend_cache.read_text(encoding="utf-8").strip() == frontend_digest
+        )
         pkg_json = frontend_dir / "package.json"
-        if pkg_json.exists():
+        if frontend_unchanged:
+            print("[3/5] Frontend: sources unchanged since last build, reusing dist/ (--force to rebuild)")
+        elif pkg_json.exists():
+            # Fast checks before build (Phase 5)
             try:
                 pkg = _json.loads(pkg_json.read_text(encoding="utf-8"))
                 if "lint" in pkg.get("scripts", {}):
                     print("[3/5] Frontend: npm run lint...")
-                    _run(["npm", "run", "lint"], cwd=frontend_dir, env=env, shell=sys.platform == "win32")
+                    await _run_async(["npm", "run", "lint"], cwd=frontend_dir, env=env, shell=sys.platform == "win32")
             except Exception:
                 pass
-        if (frontend_dir / "tsconfig.json").exists():
-            print("[3/5] Frontend: tsc --noEmit...")
-            _run(["npx", "tsc", "--noEmit"], cwd=frontend_dir, env=env, shell=sys.platform == "win32")
-        print("[3/5] Frontend: npm run build...")
-        _run(["npm", "run", "build"], cwd=frontend_dir, env=env, shell=sys.platform == "win32")
+        if not frontend_unchanged:
+            if (frontend_dir / "tsconfig.json").exists():
+                print("[3/5] Frontend: tsc --noEmit...")
+                await _run_async(["npx", "tsc", "--noEmit"], cwd=frontend_dir, env=env, shell=sys.platform == "win32")
+            print("[3/5] Frontend: npm run build...")
+            await _run_async(["npm", "run", "build"], cwd=frontend_dir, env=env, shell=sys.platform == "win32")
+            frontend_cache.parent.mkdir(parents=True, exist_ok=True)
+            frontend_cache.write_text(frontend_digest + "\n", encoding="utf-8")
         print()
 
         # 4) Tauri release build (NSIS)
         print("[4/5] Tauri build (release)...")
-        _run(["npx", "tauri", "build"], cwd=frontend_dir, env=env, shell=sys.platform == "win32")
+        print("  CARGO_TARGET_DIR:", env["CARGO_TARGET_DIR"])
+        try:
+            # Hung cargo/rustc must fail the build, not stall CI
+            await asyncio.wait_for(
+                _run_async(["npx", "tauri", "build"], cwd=frontend_dir, env=env, shell=sys.platform == "win32"),
+                timeout=TAURI_BUILD_TIMEOUT_S,
+            )
+        except asyncio.TimeoutError:
+            print(f"BUILD FAILS: Tauri build exceeded {TAURI_BUILD_TIMEOUT_S} s and was killed.")
+            return 1
         tauri_ok = True
         print()
     except (subprocess.CalledProcessError, FileNotFoundError) as e:
@@ -285,17 +457,20 @@ def main() -> int:
         print()
 
     # 5) [FINAL] E2E test: silent install -> task registered + run -> /health -> POST /api/v1/analyze (expect 501)
-    bundle = root / "app" / "frontend" / "src-tauri" / "target" / "release" / "bundle"
+    bundle = cargo_target / "release" / "bundle"
     nsis_dir = bundle / "nsis"
     if sys.platform == "win32" and nsis_dir.is_dir() and list(nsis_dir.glob("*.exe")):
         print("[5/5] E2E test (install NSIS -> task + health + analyze)...")
         test_script = root / "packaging" / "test_installed_task_end_to_end.py"
         if test_script.exists():
             repo_arg = _short_path(root) if sys.platform == "win32" else str(root)
-            rc_final = subprocess.run(
+            e2e_env = os.environ.copy()
+            e2e_env["CARGO_TARGET_DIR"] = str(cargo_target)
+            rc_final = await asyncio.to_thread(
+                subprocess.run,
                 [sys.executable, str(test_script), "--repo-root", repo_arg],
                 cwd=str(root),
-                env=os.environ.copy(),
+                env=e2e_env,
                 check=False,
                 timeout=300,
             )
@@ -324,5 +499,12 @@ def main() -> int:
     return 0
 
 
+def main() -> int:
+    parser = argparse.ArgumentParser(description="AI Mentor one-click Windows desktop build")
+    parser.add_argument("--force", action="store_true", help="Rebuild the frontend even if its sources are unchanged")
+    args = parser.parse_args()
+    return asyncio.run(main_async(force=args.force))
+
+
 if __name__ == "__main__":
     sys.exit(main())
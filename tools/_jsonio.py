@@ -0,0 +1,59 @@
+"""
+JSON report serialization shared by the tools/ CLIs: orjson when installed, stdlib json otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+if orjson is not None:
+    # Passthrough sends datetimes/dataclasses to default=str, as the stdlib path does
+    _BASE_OPTION = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    _STABLE_OPTION = _BASE_OPTION | orjson.OPT_SORT_KEYS
+
+
+def _str_keys(obj: object) -> object:
+    """Copy of obj with every dict key converted to its JSON string form, so keys sort as strings (as orjson does)."""
+    if isinstance(obj, dict):
+        return {
+            (k if isinstance(k, str) else json.dumps(k) if k is None or isinstance(k, (bool, int, float)) else str(k)): _str_keys(v)
+            for k, v in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_str_keys(v) for v in obj]
+    return obj
+
+
+def stable_json_bytes(obj: object) -> bytes:
+    """
+    Sorted-key compact JSON as UTF-8 bytes. Non-string keys are converted to strings before sorting, so
+    {10: 1, 2: 2} sorts as "10" < "2" and mixed str/int keys work on both backends. Both backends write
+    non-ASCII text unescaped and stringify unknown types with str(); NaN/Infinity floats still differ
+    (orjson writes null).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_STABLE_OPTION, default=str)
+    return json.dumps(
+        _str_keys(obj), sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    ).encode("utf-8")
+
+
+def json_bytes(obj: object, *, pretty: bool = False) -> bytes:
+    """Insertion-order JSON as UTF-8 bytes, compact or indented by 2; same type handling as stable_json_bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=(_BASE_OPTION | orjson.OPT_INDENT_2) if pretty else _BASE_OPTION, default=str)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+
+def json_loads(data: bytes | str) -> object:
+    """Parse JSON text or UTF-8 bytes; orjson's decode error subclasses json.JSONDecodeError, so callers catch one type."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
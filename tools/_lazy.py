@@ -0,0 +1,30 @@
+"""
+Lazy backend imports shared by the tools/ CLIs: heavy modules load only on the code paths that use them.
+Callers put backend/ on sys.path first (as every tool does at import time).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.config import Settings
+
+_models_loaded = False
+
+
+def ensure_models() -> None:
+    """Import backend `models` once so all ORM tables are registered before a DB session opens."""
+    global _models_loaded
+    if _models_loaded:
+        return
+    import models  # noqa: F401 - register models
+
+    _models_loaded = True
+
+
+def settings() -> Settings:
+    """Backend settings, importing core.config on first use (get_settings() is lru_cached, so env is parsed once)."""
+    from core.config import get_settings
+
+    return get_settings()
@@ -0,0 +1,128 @@
+"""
+Ops CLI command implementations (burn-in-run, health-check, plan-tuning).
+Imported by tools/ops.py only after argument parsing; backend imports stay at function scope.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import _runloop
+from _lazy import ensure_models, settings
+
+
+def _cmd_burn_in_run(args: argparse.Namespace) -> int:
+    from core.database import init_database, dispose_database, get_database_manager
+    from runner.burn_in_ops_runner import run_burn_in_ops
+
+    async def _run() -> int:
+        ensure_models()
+        await init_database(settings().database_url, pool_size=1, max_overflow=0)
+        try:
+            async with get_database_manager().session() as session:
+                result = await run_burn_in_ops(
+                    session,
+                    connector_name=args.connector,
+                    match_ids=args.match_ids.split(",") if getattr(args, "match_ids", None) else None,
+                    enable_activation=args.activation,
+                    dry_run=args.dry_run,
+                    reports_dir=args.output_dir,
+                    index_path=Path(args.output_dir) / "index.json",
+                    max_bundles_retained=args.max_bundles,
+                )
+        finally:
+            await dispose_database()
+
+        if result.get("error"):
+            print(result.get("detail", result.get("error")), file=sys.stderr)
+            return 1
+        bundle_dir = result.get("_bundle_dir", "")
+        print(f"{result.get('run_id')},{result.get('status')},{result.get('alerts_count', 0)},{result.get('activated', False)},{bundle_dir}")
+        return 0
+
+    return _runloop.run(_run())
+
+
+def _cmd_health_check(_args: argparse.Namespace) -> int:
+    # Each check imports its own subsystem, so one broken import cannot hide the other diagnostics
+    async def _run() -> int:
+        repo_root = Path(__file__).resolve().parent.parent
+        from core.database import init_database, dispose_database, get_database_manager
+
+        ensure_models()
+        await init_database(settings().database_url, pool_size=1, max_overflow=0)
+        results = []
+        try:
+            async with get_database_manager().session() as session:
+                from readiness.checks import run_readiness_checks
+
+                results = await run_readiness_checks(repo_root=repo_root, session=session)
+        except Exception as e:
+            results = [{"code": "SESSION", "status": "FAIL", "message": str(e)}]
+        finally:
+            await dispose_database()
+
+        # Policy presence
+        try:
+            from policy.policy_runtime import get_active_policy
+
+            get_active_policy()
+            results.append({"code": "POLICY_LOAD", "status": "PASS", "message": "Active policy loads."})
+        except Exception as e:
+            results.append({"code": "POLICY_LOAD", "status": "FAIL", "message": str(e)})
+
+        # Connector availability (at least one recorded-first)
+        from ingestion.registry import list_registered_connectors
+        from ingestion.live_io import get_connector_safe
+
+        connectors = list_registered_connectors()
+        available = [c for c in connectors if get_connector_safe(c) is not None]
+        if available:
+            results.append({"code": "CONNECTOR", "status": "PASS", "message": f"Available connectors: {', '.join(sorted(available))}."})
+        else:
+            results.append({"code": "CONNECTOR", "status": "WARN", "message": f"No connector available (LIVE_IO_ALLOWED or recorded). Registered: {', '.join(connectors)}."})
+
+        failed = [r for r in results if r.get("status") == "FAIL"]
+        sys.stdout.write("".join(f"{r.get('status')}\t{r.get('code')}\t{r.get('message', '')}\n" for r in results))
+        return 1 if failed else 0
+
+    return _runloop.run(_run())
+
+
+def _cmd_plan_tuning(args: argparse.Namespace) -> int:
+    import asyncio
+
+    from core.database import init_database, dispose_database, get_database_manager
+    from offline_eval.decision_quality import compute_decision_quality_report, load_history_from_session
+    from runner.tuning_plan_runner import run_plan_tuning
+
+    async def _run() -> int:
+        ensure_models()
+        await init_database(settings().database_url, pool_size=1, max_overflow=0)
+        try:
+            # Release the load session before the CPU-bound report; run_plan_tuning only touches
+            # its session when records are not supplied, so the second one never checks out a connection.
+            async with get_database_manager().session() as session:
+                records = await load_history_from_session(session, limit=args.last_n)
+            quality_report = await asyncio.to_thread(compute_decision_quality_report, records) if records else {}
+            async with get_database_manager().session() as session:
+                result = await run_plan_tuning(
+                    session,
+                    last_n=args.last_n,
+                    quality_audit_report=quality_report,
+                    records=records,
+                    dry_run=args.dry_run,
+                    reports_dir=args.output_dir,
+                    index_path=Path(args.output_dir) / "index.json",
+                )
+        finally:
+            await dispose_database()
+
+        status = result.get("status", "FAIL")
+        reasons = result.get("reasons") or []
+        sys.stdout.write("".join(f"{line}\n" for line in (status, *reasons)))
+        return 0 if status == "PASS" else 1
+
+    return _runloop.run(_run())
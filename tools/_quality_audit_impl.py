@@ -0,0 +1,80 @@
+"""
+Quality audit implementation: load history, compute the decision quality report, write it and index it.
+Imported by tools/quality_audit.py after argument parsing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import secrets
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from _jsonio import stable_json_bytes
+from _lazy import ensure_models, settings
+
+
+def _run_id() -> str:
+    return f"quality_audit_{time.strftime('%Y%m%d_%H%M%S', time.gmtime())}_{secrets.token_hex(4)}"
+
+
+def _parse_utc(s: str | None) -> datetime | None:
+    if not s or not s.strip():
+        return None
+    s = s.strip().replace("Z", "+00:00")
+    return datetime.fromisoformat(s).replace(tzinfo=timezone.utc)
+
+
+async def run_quality_audit(args: argparse.Namespace) -> int:
+    """Run the audit for parsed quality_audit CLI args; prints '<run_id>,<report_path>'."""
+    # Backend imports at function scope, like the ops commands
+    from core.database import init_database, dispose_database, get_database_manager
+    from offline_eval.decision_quality import compute_decision_quality_report, load_history_from_session
+    from reports.index_store import append_quality_audit_run_jsonl
+
+    from_utc = _parse_utc(args.date_from)
+    to_utc = _parse_utc(args.date_to)
+    limit = args.last_n if args.last_n is not None else 5000
+
+    ensure_models()
+    await init_database(settings().database_url, pool_size=1, max_overflow=0)
+    try:
+        async with get_database_manager().session() as session:
+            records = await load_history_from_session(
+                session,
+                from_utc=from_utc,
+                to_utc=to_utc,
+                limit=limit,
+            )
+    finally:
+        await dispose_database()
+
+    report = compute_decision_quality_report(records)
+
+    run_id = _run_id()
+    created_at = datetime.now(timezone.utc).replace(microsecond=0).isoformat() + "Z"
+    payload = {
+        "run_id": run_id,
+        "created_at_utc": created_at,
+        "run_count": len(records),
+        "params": {"last_n": args.last_n, "date_from": args.date_from, "date_to": args.date_to, "limit": limit},
+        "report": report,
+    }
+
+    output_dir = Path(args.output_dir)
+    out_subdir = output_dir / "quality_audit"
+    out_subdir.mkdir(parents=True, exist_ok=True)
+    report_path = out_subdir / f"{run_id}.json"
+    report_path.write_bytes(stable_json_bytes(payload))
+
+    # One appended line instead of rewriting index.json; report retention compacts the sidecar
+    append_quality_audit_run_jsonl(output_dir / "index.json", {
+        "run_id": run_id,
+        "created_at_utc": created_at,
+        "run_count": len(records),
+        "summary": report.get("summary", {}),
+    })
+
+    print(f"{run_id},{report_path}")
+    return 0
@@ -0,0 +1,23 @@
+"""
+Event-loop entry point shared by the tools/ CLIs: uvloop when installed, stdlib asyncio otherwise.
+uvloop is imported inside run() so --help and usage errors never pay for it (and Windows, which has no uvloop, falls back silently).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run coro to completion on a fresh loop, like asyncio.run()."""
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
@@ -7,14 +7,74 @@ from __future__ import annotations
 
 import argparse
 import json
+import math
 import sys
 from pathlib import Path
+from typing import Iterator
+
+try:
+    import ijson
+except ImportError:
+    ijson = None  # type: ignore[assignment]
+
+# Top-level live_analyze.json keys read by format_burn_in_summary (live_analysis_reports handled separately)
+_LIVE_ANALYZE_KEYS = frozenset({"alerts", "summary", "latency_ms"})
+_SCALAR_EVENTS = frozenset({"number", "string", "boolean", "null"})
+_LOAD_ERRORS: tuple[type[Exception], ...] = (json.JSONDecodeError, OSError) + ((ijson.JSONError,) if ijson is not None else ())
 
 _repo_root = Path(__file__).resolve().parent.parent
 _backend = _repo_root / "backend"
 if str(_backend) not in sys.path:
     sys.path.insert(0, str(_backend))
 
+from _jsonio import json_loads
+
+
+def _extract_live_analyze(p: Path) -> dict:
+    """
+    Load only the parts of live_analyze.json the summary needs.
+    With ijson, one streaming pass builds the small top-level keys as-is and reduces each report to its
+    decision confidences, so unread regions are never materialized. Without ijson, parse the whole file.
+    """
+    if ijson is None:
+        return json_loads(p.read_bytes())
+    out: dict = {}
+    # match_id -> (analyzer decisions, top-level decisions); the summary prefers the analyzer list when non-empty
+    reports: dict = {}
+    with open(p, "rb") as f:
+        key = builder = None
+        match_id = analyzer_item = direct_item = decision = None
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == "" and event in ("map_key", "end_map"):
+                if builder is not None:
+                    out[key] = builder.value
+                key = value
+                builder = ijson.ObjectBuilder() if event == "map_key" and value in _LIVE_ANALYZE_KEYS else None
+            elif builder is not None:
+                builder.event(event, value)
+            elif key != "live_analysis_reports":
+                continue
+            elif prefix == "live_analysis_reports":
+                if event == "map_key":
+                    match_id = value
+                    analyzer_item = f"live_analysis_reports.{value}.analyzer.decisions.item"
+                    direct_item = f"live_analysis_reports.{value}.decisions.item"
+            elif event == "start_map" and prefix == f"live_analysis_reports.{match_id}":
+                reports[match_id] = ([], [])
+            elif event == "start_map" and prefix in (analyzer_item, direct_item) and match_id in reports:
+                decision = {"confidence": None}
+                reports[match_id][prefix == direct_item].append(decision)
+            elif decision is not None and event in _SCALAR_EVENTS and prefix in (
+                f"{analyzer_item}.confidence",
+                f"{direct_item}.confidence",
+            ):
+                decision["confidence"] = value
+    if reports:
+        out["live_analysis_reports"] = {
+            mid: {"decisions": analyzer or direct} for mid, (analyzer, direct) in reports.items()
+        }
+    return out
+
 
 def load_latest_bundle(reports_dir: str | Path) -> dict | None:
     """Load latest burn-in bundle (summary + live_compare + live_analyze). Returns None if no run."""
@@ -33,37 +93,59 @@ def load_latest_bundle(reports_dir: str | Path) -> dict | None:
     summary_path = bundle_dir / "summary.json"
     if not summary_path.is_file():
         return None
-    out = {"run_id": run_id, "summary": json.loads(summary_path.read_text(encoding="utf-8"))}
+    out = {"run_id": run_id, "summary": json_loads(summary_path.read_bytes())}
     for name, f in (("live_compare", "live_compare.json"), ("live_analyze", "live_analyze.json")):
         p = bundle_dir / f
         if p.is_file():
             try:
-                out[name] = json.loads(p.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError):
+                out[name] = _extract_live_analyze(p) if name == "live_analyze" else json_loads(p.read_bytes())
+            except _LOAD_ERRORS:
                 out[name] = {}
     return out
 
 
+def _iter_confidences(live_analyze: dict) -> Iterator[float]:
+    """Yield every numeric decision confidence across live_analysis_reports (single flat pass)."""
+    for report in (live_analyze.get("live_analysis_reports") or {}).values():
+        for d in report.get("analyzer", {}).get("decisions") or report.get("decisions") or []:
+            c = d.get("confidence")
+            if c is None:
+                continue
+            try:
+                yield float(c)
+            except (TypeError, ValueError):
+                pass
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    """Linear-interpolated percentile (numpy default method) over an already sorted list."""
+    k = (len(sorted_values) - 1) * q / 100.0
+    lo = math.floor(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
 def format_burn_in_summary(bundle: dict) -> str:
     """Produce a concise text summary from a loaded bundle (no persistence)."""
-    lines = []
     summary = bundle.get("summary") or {}
     run_id = summary.get("run_id") or bundle.get("run_id") or "?"
-    lines.append(f"Run: {run_id}")
-    lines.append(f"Status: {summary.get('status', '?')}")
-    lines.append(f"Alerts: {summary.get('alerts_count', 0)}")
-    lines.append(f"Activated: {summary.get('activated', False)}")
-    lines.append(f"Matches: {summary.get('matches_count', 0)}")
-    lines.append(f"Connector: {summary.get('connector_name', '?')}")
+    lines = [
+        f"Run: {run_id}",
+        f"Status: {summary.get('status', '?')}",
+        f"Alerts: {summary.get('alerts_count', 0)}",
+        f"Activated: {summary.get('activated', False)}",
+        f"Matches: {summary.get('matches_count', 0)}",
+        f"Connector: {summary.get('connector_name', '?')}",
+    ]
 
     live_analyze = bundle.get("live_analyze") or {}
     alerts = live_analyze.get("alerts") or []
     if alerts:
         lines.append("Alert details:")
-        for a in alerts[:10]:
-            code = a.get("code") or a.get("type") or "?"
-            msg = a.get("message") or a.get("detail") or str(a)[:80]
-            lines.append(f"  - {code}: {msg}")
+        lines.extend(
+            f"  - {a.get('code') or a.get('type') or '?'}: {a.get('message') or a.get('detail') or str(a)[:80]}"
+            for a in alerts[:10]
+        )
         if len(alerts) > 10:
             lines.append(f"  ... and {len(alerts) - 10} more")
 
@@ -83,19 +165,12 @@ def format_burn_in_summary(bundle: dict) -> str:
         lines.append(f"Avg latency (ms): {latency_ms:.0f}")
 
     # Confidence stats: from live_analyze per_match or live_analysis_reports
-    confs = []
-    for match_id, report in (live_analyze.get("live_analysis_reports") or {}).items():
-        dec = report.get("analyzer", {}).get("decisions") or report.get("decisions") or []
-        for d in dec:
-            c = d.get("confidence")
-            if c is not None:
-                try:
-                    confs.append(float(c))
-                except (TypeError, ValueError):
-                    pass
+    confs = sorted(_iter_confidences(live_analyze))
     if confs:
-        avg = sum(confs) / len(confs)
-        lines.append(f"Confidence: avg={avg:.2f} count={len(confs)}")
+        avg = math.fsum(confs) / len(confs)
+        p50 = _percentile(confs, 50)
+        p95 = _percentile(confs, 95)
+        lines.append(f"Confidence: avg={avg:.2f} p50={p50:.2f} p95={p95:.2f} count={len(confs)}")
 
     return "\n".join(lines)
 
@@ -4,15 +4,16 @@ Decision audit CLI: compare current vs proposed policy on snapshots;
 write audit_report.json with per-market rows and summary.
 
 Usage:
-  python tools/decision_audit.py --snapshots path/to/snapshots.json --proposal path/to/proposal.json [--output audit_report.json] [--all]
+  python tools/decision_audit.py --snapshots path/to/snapshots.json --proposal path/to/proposal.json [--output audit_report.json] [--all] [--pretty]
   --all: include all rows (default: first 200)
+  --pretty: indent the JSON report (default: compact)
 """
 
 from __future__ import annotations
 
 import argparse
-import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 _REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -20,6 +21,7 @@ _BACKEND = _REPO_ROOT / "backend"
 if _BACKEND.is_dir() and str(_BACKEND) not in sys.path:
     sys.path.insert(0, str(_BACKEND))
 
+from _jsonio import json_bytes, json_loads
 from policy.policy_model import Policy
 from policy.policy_runtime import get_active_policy
 from policy.audit import audit_snapshots
@@ -28,27 +30,32 @@ DEFAULT_ROWS_LIMIT = 200
 
 
 def load_snapshots(path: Path) -> list[dict]:
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
+    data = json_loads(path.read_bytes())
     if isinstance(data, list):
         return data
     return [data]
 
 
-def load_proposed_policy(path: Path) -> Policy:
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
+@lru_cache(maxsize=4)
+def _load_proposed_policy_cached(resolved_path: str, mtime_ns: int, size: int) -> Policy:
+    data = json_loads(Path(resolved_path).read_bytes())
     if "proposed_policy" in data:
         return Policy.model_validate(data["proposed_policy"])
     return Policy.model_validate(data)
 
 
+def load_proposed_policy(path: Path) -> Policy:
+    st = path.stat()
+    return _load_proposed_policy_cached(str(path.resolve()), st.st_mtime_ns, st.st_size)
+
+
 def main() -> int:
     ap = argparse.ArgumentParser(description="Decision audit: current vs proposed policy on snapshots")
     ap.add_argument("--snapshots", type=Path, required=True, help="JSON: list of { match_id, evidence_pack }")
     ap.add_argument("--proposal", type=Path, required=True, help="JSON: proposal with proposed_policy or Policy")
     ap.add_argument("--output", type=Path, default=Path("audit_report.json"), help="Output report path")
     ap.add_argument("--all", action="store_true", help="Include all rows (default: first %d)" % DEFAULT_ROWS_LIMIT)
+    ap.add_argument("--pretty", action="store_true", help="Write indented JSON (default: compact)")
     args = ap.parse_args()
 
     snapshots = load_snapshots(args.snapshots)
@@ -58,15 +65,14 @@ def main() -> int:
     report = audit_snapshots(snapshots, current_policy, proposed_policy)
 
     if not args.all and report["rows"]:
-        report["rows"] = report["rows"][:DEFAULT_ROWS_LIMIT]
+        del report["rows"][DEFAULT_ROWS_LIMIT:]
         report["_rows_truncated"] = True
         report["_rows_limit"] = DEFAULT_ROWS_LIMIT
     else:
         report["_rows_truncated"] = False
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2)
+    args.output.write_bytes(json_bytes(report, pretty=args.pretty))
 
     s = report["summary"]
     print(f"Total markets: {s['total_markets']}, changed: {s['changed_count']}, unchanged: {s['unchanged_count']}", file=sys.stderr)
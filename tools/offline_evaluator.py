@@ -11,11 +11,13 @@ Uses the same DB as the backend (analysis_runs + snapshot_resolutions).
 from __future__ import annotations
 
 import argparse
-import asyncio
 import json
 import sys
+from bisect import bisect_right
+from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 # Add backend to path when run from repo root
 _SCRIPT_DIR = Path(__file__).resolve().parent
@@ -24,34 +26,126 @@ _BACKEND = _REPO_ROOT / "backend"
 if _BACKEND.is_dir() and str(_BACKEND) not in sys.path:
     sys.path.insert(0, str(_BACKEND))
 
-from core.config import get_settings
-from core.database import init_database, dispose_database
-from evaluation.attribution import (
-    emit_attribution_rows,
-    market_outcomes_from_resolution,
-    reason_codes_by_market_from_resolution,
-)
-from repositories.analysis_run_repo import AnalysisRunRepository
-from repositories.prediction_repo import PredictionRepository
-from repositories.snapshot_resolution_repo import SnapshotResolutionRepository
+import _runloop
+from _lazy import settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
-CONFIDENCE_BANDS = [
+
+CONFIDENCE_BANDS = (
     (0.50, 0.55),
     (0.55, 0.60),
     (0.60, 0.65),
     (0.65, 0.70),
     (0.70, 1.00),
-]
+)
+# Sorted, contiguous bands: upper bounds for bisect and the matching labels
+_BAND_HIS = tuple(hi for _, hi in CONFIDENCE_BANDS)
+_BAND_LABELS = tuple(f"{lo:.2f}-{hi:.2f}" for lo, hi in CONFIDENCE_BANDS)
 
 
 def _band_for_confidence(c: float) -> str | None:
     """Return band label like '0.50-0.55' or None if out of range."""
-    for lo, hi in CONFIDENCE_BANDS:
-        if lo <= c < hi:
-            return f"{lo:.2f}-{hi:.2f}"
+    i = bisect_right(_BAND_HIS, c)
+    if i < len(_BAND_LABELS) and c >= CONFIDENCE_BANDS[i][0]:
+        return _BAND_LABELS[i]
     return None
 
 
+def _accuracy(s: int, f: int) -> float | None:
+    """Success share of decided outcomes (neutral excluded), 4 dp; None when nothing was decided."""
+    d = s + f
+    return round(s / d, 4) if d else None
+
+
+_MARKETS = ("one_x_two", "over_under_25", "gg_ng")
+# Prediction.market spellings -> report market keys
+_PRED_MARKET_KEYS = {"1X2": "one_x_two", "OU25": "over_under_25", "OU_2.5": "over_under_25", "GGNG": "gg_ng", "BTTS": "gg_ng"}
+# Outcome -> counter bucket; anything else (NEUTRAL, UNRESOLVED, missing) is neutral
+_OUTCOME_BUCKET = {"SUCCESS": "success", "FAILURE": "failure"}
+# Below this many resolved runs, process start-up costs more than the aggregation itself
+PARALLEL_MIN_RUNS = 500
+_PARALLEL_CHUNK = 250
+
+# One resolved run as plain (picklable) data: market_outcomes_json, reason_codes_by_market_json,
+# [(prediction market, confidence), ...]
+_RunItem = tuple[Any, Any, list[tuple[str | None, float | None]]]
+_Counts = tuple[dict[tuple[str, str], int], dict[tuple[str, str, str], int], dict[tuple[str, str, str], int]]
+
+
+def _aggregate(items: list[_RunItem]) -> _Counts:
+    """Count outcomes for a batch of runs into flat (market, bucket), (market, band, bucket) and
+    (code, market, bucket) counters. Module-level so ProcessPoolExecutor workers can run it."""
+    from evaluation.attribution import (
+        coerce_market_outcomes,
+        coerce_reason_codes_by_market,
+        emit_attribution_rows,
+    )
+
+    markets = _MARKETS
+    outcome_bucket = _OUTCOME_BUCKET
+    key_map = _PRED_MARKET_KEYS
+    # Flat counters keyed by tuples: one hash lookup per increment instead of nested dicts
+    market_counts: defaultdict[tuple[str, str], int] = defaultdict(int)
+    band_counts: defaultdict[tuple[str, str, str], int] = defaultdict(int)
+    reason_counts: defaultdict[tuple[str, str, str], int] = defaultdict(int)
+
+    for mo_raw, rc_raw, preds in items:
+        # Decode each resolution JSON column once; reused by banding and attribution
+        mo = coerce_market_outcomes(mo_raw)
+        rc = coerce_reason_codes_by_market(rc_raw)
+        buckets = {m: outcome_bucket.get(mo.get(m), "neutral") for m in markets}
+        for m in markets:
+            market_counts[(m, buckets[m])] += 1
+
+        # Confidence banding: only when every market has a prediction confidence
+        market_to_confidence: dict[str, float | None] = {}
+        for market, confidence in preds:
+            k = key_map.get((market or "").upper(), "")
+            if k and k in markets:
+                market_to_confidence[k] = confidence
+        if all(market_to_confidence.get(m) is not None for m in markets):
+            for m in markets:
+                band = _band_for_confidence(float(market_to_confidence[m]))
+                if band is not None:
+                    band_counts[(m, band, buckets[m])] += 1
+
+        # Reason attribution
+        for row in emit_attribution_rows(rc, mo):
+            reason_counts[(row.reason_code, row.market, outcome_bucket.get(row.outcome, "neutral"))] += 1
+
+    return dict(market_counts), dict(band_counts), dict(reason_counts)
+
+
+def _aggregate_parallel(items: list[_RunItem]) -> _Counts:
+    """_aggregate over chunks in worker processes; counters are additive, so partials are summed."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunks = [items[i : i + _PARALLEL_CHUNK] for i in range(0, len(items), _PARALLEL_CHUNK)]
+    totals: _Counts = ({}, {}, {})
+    with ProcessPoolExecutor() as pool:
+        for partial in pool.map(_aggregate, chunks):
+            for total, counts in zip(totals, partial):
+                for key, n in counts.items():
+                    total[key] = total.get(key, 0) + n
+    return totals
+
+
+def _report_bytes(report: dict) -> bytes:
+    """Indented, key-sorted report JSON (orjson when installed, same layout via stdlib otherwise)."""
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS, default=str)
+    return json.dumps(report, indent=2, sort_keys=True, default=str).encode("utf-8")
+
+
+def _write_report(output_path: Path, report: dict) -> None:
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(_report_bytes(report))
+
+
 async def run_evaluator(
     from_date: datetime | None,
     to_date: datetime | None,
@@ -59,11 +153,16 @@ async def run_evaluator(
     output_path: Path,
 ) -> None:
     """Load snapshots (analysis runs), filter, aggregate, write report."""
-    settings = get_settings()
-    await init_database(settings.database_url)
+    # Backend imports deferred to here so --help does not pay for ORM/repository setup
+    from core.database import init_database, dispose_database, get_database_manager
+    from repositories.analysis_run_repo import AnalysisRunRepository
+    from repositories.prediction_repo import PredictionRepository
+    from repositories.snapshot_resolution_repo import SnapshotResolutionRepository
+    from sqlalchemy.exc import OperationalError, ProgrammingError
+
+    await init_database(settings().database_url, pool_size=1, max_overflow=0)
 
     try:
-        from core.database import get_database_manager
         async with get_database_manager().session() as session:
             run_repo = AnalysisRunRepository(session)
             resolution_repo = SnapshotResolutionRepository(session)
@@ -74,127 +173,82 @@ async def run_evaluator(
                 to_utc=to_date,
                 limit=5000,
             )
-            total_snapshots = len(runs)
+            # Only the ids are needed from here on; drop the ORM rows before aggregating
+            run_ids = [run.id for run in runs]
+            del runs
+            total_snapshots = len(run_ids)
+
+            # Two batched IN queries instead of two awaits per run
+            resolutions: dict[int, Any] = {}
+            for res in await resolution_repo.list_by_analysis_run_ids(run_ids):
+                resolutions.setdefault(res.analysis_run_id, res)
 
-            resolved: list[tuple[any, any]] = []  # (run, resolution)
-            for run in runs:
-                res = await resolution_repo.get_by_analysis_run_id(run.id)
-                if res is None and only_final:
+            preds_by_run: dict[int, list[Any]] = defaultdict(list)
+            for p in await pred_repo.list_by_analysis_run_ids(list(resolutions)):
+                preds_by_run[p.analysis_run_id].append(p)
+
+            # Single pass in run order; pop so each ORM row is released once reduced to plain data
+            items: list[_RunItem] = []
+            for run_id in run_ids:
+                res = resolutions.pop(run_id, None)
+                if res is None:
+                    # Unresolved runs have no outcomes to aggregate (skipped with or without only_final)
                     continue
-                if res is not None:
-                    resolved.append((run, res))
+                items.append((
+                    res.market_outcomes_json,
+                    res.reason_codes_by_market_json,
+                    [(p.market, getattr(p, "confidence", None)) for p in preds_by_run.pop(run_id, ())],
+                ))
+            resolved_snapshots = len(items)
 
-            resolved_snapshots = len(resolved)
+            if resolved_snapshots >= PARALLEL_MIN_RUNS:
+                market_counts, band_counts, reason_counts = _aggregate_parallel(items)
+            else:
+                market_counts, band_counts, reason_counts = _aggregate(items)
+            del items
 
-            # Per-market counts
-            markets = ("one_x_two", "over_under_25", "gg_ng")
-            per_market: dict[str, dict[str, int]] = {
-                m: {"success_count": 0, "failure_count": 0, "neutral_count": 0}
-                for m in markets
-            }
-            # Confidence bands per market
-            bands_label = [f"{lo:.2f}-{hi:.2f}" for lo, hi in CONFIDENCE_BANDS]
-            per_market_bands: dict[str, dict[str, dict[str, int]]] = {
-                m: {b: {"success_count": 0, "failure_count": 0, "neutral_count": 0} for b in bands_label}
-                for m in markets
-            }
-            # Reason effectiveness: per reason_code per market
-            reason_stats: dict[str, dict[str, dict[str, int]]] = {}  # code -> market -> count
-
-            for run, res in resolved:
-                mo_raw = res.market_outcomes_json
-                try:
-                    mo = json.loads(mo_raw) if isinstance(mo_raw, str) else (mo_raw or {})
-                except (TypeError, ValueError):
-                    mo = {}
-                for m in markets:
-                    outcome = mo.get(m, "UNRESOLVED")
-                    if outcome == "SUCCESS":
-                        per_market[m]["success_count"] += 1
-                    elif outcome == "FAILURE":
-                        per_market[m]["failure_count"] += 1
-                    else:
-                        per_market[m]["neutral_count"] += 1
-
-                # Confidence banding: get predictions for this run
-                preds = await pred_repo.list_by_analysis_run(run.id)
-                market_to_confidence: dict[str, float] = {}
-                key_map = {"1X2": "one_x_two", "OU25": "over_under_25", "OU_2.5": "over_under_25", "GGNG": "gg_ng", "BTTS": "gg_ng"}
-                for p in preds:
-                    k = key_map.get((p.market or "").upper(), "")
-                    if k and k in markets:
-                        market_to_confidence[k] = getattr(p, "confidence", None) if hasattr(p, "confidence") else None
-                if all(market_to_confidence.get(m) is not None for m in markets):
-                    for m in markets:
-                        c = market_to_confidence.get(m)
-                        if c is not None:
-                            band = _band_for_confidence(float(c))
-                            if band and band in per_market_bands[m]:
-                                outcome = mo.get(m, "UNRESOLVED")
-                                if outcome == "SUCCESS":
-                                    per_market_bands[m][band]["success_count"] += 1
-                                elif outcome == "FAILURE":
-                                    per_market_bands[m][band]["failure_count"] += 1
-                                else:
-                                    per_market_bands[m][band]["neutral_count"] += 1
-
-                # Reason attribution
-                reason_codes = reason_codes_by_market_from_resolution({
-                    "reason_codes_by_market_json": getattr(res, "reason_codes_by_market_json", None),
-                })
-                outcomes = market_outcomes_from_resolution({
-                    "market_outcomes_json": getattr(res, "market_outcomes_json", None),
-                })
-                for row in emit_attribution_rows(reason_codes, outcomes):
-                    code = row.reason_code
-                    if code not in reason_stats:
-                        reason_stats[code] = {m: {"success": 0, "failure": 0, "neutral": 0} for m in markets}
-                    if row.market not in reason_stats[code]:
-                        reason_stats[code][row.market] = {"success": 0, "failure": 0, "neutral": 0}
-                    if row.outcome == "SUCCESS":
-                        reason_stats[code][row.market]["success"] += 1
-                    elif row.outcome == "FAILURE":
-                        reason_stats[code][row.market]["failure"] += 1
-                    else:
-                        reason_stats[code][row.market]["neutral"] += 1
-
-            # Build report
-            def accuracy(s: int, f: int) -> float | None:
-                if s + f == 0:
-                    return None
-                return round(s / (s + f), 4)
+            markets = _MARKETS
 
+            # Build report (nested structure materialized once from the flat counters)
             per_market_report = {}
             for m in markets:
-                d = per_market[m]
-                s, f, n = d["success_count"], d["failure_count"], d["neutral_count"]
+                s, f, n = (market_counts.get((m, b), 0) for b in ("success", "failure", "neutral"))
                 per_market_report[m] = {
                     "success_count": s,
                     "failure_count": f,
                     "neutral_count": n,
-                    "accuracy": accuracy(s, f),
+                    "accuracy": _accuracy(s, f),
                 }
-                if any(per_market_bands[m][b]["success_count"] or per_market_bands[m][b]["failure_count"] for b in bands_label):
-                    per_market_report[m]["confidence_bands"] = {}
-                    for b in bands_label:
-                        sb = per_market_bands[m][b]
-                        if sb["success_count"] + sb["failure_count"] + sb["neutral_count"] > 0:
-                            per_market_report[m]["confidence_bands"][b] = {
-                                **sb,
-                                "accuracy": accuracy(sb["success_count"], sb["failure_count"]),
-                            }
+                # One pass over the bands; attached only if some band has a decided (non-neutral) outcome
+                bands_out = {}
+                decided = False
+                for b in _BAND_LABELS:
+                    bs, bf, bn = (band_counts.get((m, b, k), 0) for k in ("success", "failure", "neutral"))
+                    if bs + bf + bn:
+                        decided = decided or bool(bs or bf)
+                        bands_out[b] = {
+                            "success_count": bs,
+                            "failure_count": bf,
+                            "neutral_count": bn,
+                            "accuracy": _accuracy(bs, bf),
+                        }
+                if decided:
+                    per_market_report[m]["confidence_bands"] = bands_out
 
+            # Every code reports all three markets, plus any other market it was attributed to
+            reason_markets: dict[str, dict[str, None]] = {}
+            for code, m, _ in reason_counts:
+                reason_markets.setdefault(code, dict.fromkeys(markets))[m] = None
             reason_effectiveness = {}
-            for code, by_market in reason_stats.items():
+            for code, by_market in reason_markets.items():
                 reason_effectiveness[code] = {}
-                for m, counts in by_market.items():
-                    s = counts["success"]
-                    f = counts["failure"]
+                for m in by_market:
+                    s, f, n = (reason_counts.get((code, m, k), 0) for k in ("success", "failure", "neutral"))
                     reason_effectiveness[code][m] = {
                         "success": s,
                         "failure": f,
-                        "neutral": counts["neutral"],
-                        "success_rate": round(s / (s + f), 4) if (s + f) > 0 else None,
+                        "neutral": n,
+                        "success_rate": _accuracy(s, f),
                     }
 
             report = {
@@ -205,21 +259,19 @@ async def run_evaluator(
                 "per_market_accuracy": per_market_report,
                 "reason_effectiveness": reason_effectiveness,
             }
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(report, f, indent=2)
+            _write_report(output_path, report)
             print(f"Wrote {output_path}", file=sys.stderr)
-    except Exception as e:
-        if "no such table" in str(e).lower() or "OperationalError" in type(e).__name__:
+    except (OperationalError, ProgrammingError) as e:
+        # Missing schema: sqlite says "no such table", Postgres "relation ... does not exist"
+        msg = str(getattr(e, "orig", e)).lower()
+        if "no such table" in msg or "does not exist" in msg:
             report = {
                 "overall": {"total_snapshots": 0, "resolved_snapshots": 0},
                 "per_market_accuracy": {},
                 "reason_effectiveness": {},
                 "warnings": ["NO_SCHEMA_DETECTED"],
             }
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(report, f, indent=2)
+            _write_report(output_path, report)
             print(f"DB not initialized or empty; wrote empty report to {output_path}", file=sys.stderr)
         else:
             raise
@@ -247,7 +299,7 @@ def main() -> int:
     to_date = _parse_iso(args.to_date) if args.to_date else None
     only_final = args.only_final and not args.all
 
-    asyncio.run(run_evaluator(from_date, to_date, only_final, args.output))
+    _runloop.run(run_evaluator(from_date, to_date, only_final, args.output))
     return 0
 
 
@@ -8,8 +8,6 @@ Exit 0 always (operational); alerts included in report.
 from __future__ import annotations
 
 import argparse
-import asyncio
-import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -19,23 +17,9 @@ _backend = Path(__file__).resolve().parent.parent / "backend"
 if str(_backend) not in sys.path:
     sys.path.insert(0, str(_backend))
 
-import models  # noqa: F401 - register models
-from core.config import get_settings
-from core.database import init_database, dispose_database, get_database_manager
-from runner.shadow_runner import run_shadow_batch
-from reports.alerts import evaluate_alerts
-from reports.index_store import (
-    append_activation_run,
-    append_burn_in_run,
-    load_index,
-    append_run,
-    save_index,
-)
-from limits.limits import prune_index
-
-
-def _stable_json(obj: object) -> str:
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+import _runloop
+from _jsonio import stable_json_bytes
+from _lazy import ensure_models, settings
 
 
 def _normalize_utc(dt: datetime) -> datetime:
@@ -61,6 +45,19 @@ async def _main() -> int:
     parser.add_argument("--activation", action="store_true", help="Enable activation (respects env gates)")
     args = parser.parse_args()
 
+    # Heavy backend imports (ORM registration, runner) deferred past argparse so --help stays instant
+    from core.database import init_database, dispose_database, get_database_manager
+    from runner.shadow_runner import run_shadow_batch
+    from reports.alerts import evaluate_alerts
+    from reports.index_store import (
+        append_activation_run,
+        append_burn_in_run,
+        load_index,
+        append_run,
+        save_index,
+    )
+    from limits.limits import prune_index
+
     now = _parse_now_utc(args.now_utc)
     if now is None:
         now = datetime.now(timezone.utc).replace(microsecond=0)
@@ -69,8 +66,8 @@ async def _main() -> int:
     if args.match_ids:
         match_ids = [m.strip() for m in args.match_ids.split(",") if m.strip()]
 
-    settings = get_settings()
-    await init_database(settings.database_url)
+    ensure_models()
+    await init_database(settings().database_url, pool_size=1, max_overflow=0)
 
     try:
         async with get_database_manager().session() as session:
@@ -100,7 +97,7 @@ async def _main() -> int:
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     report_path = output_dir / report_filename
-    report_path.write_text(_stable_json(full_report), encoding="utf-8")
+    report_path.write_bytes(stable_json_bytes(full_report))
 
     # Index entry
     run_meta_batch = batch_report.get("run_meta") or {}
@@ -150,7 +147,7 @@ async def _main() -> int:
 
 
 def main() -> None:
-    sys.exit(asyncio.run(_main()))
+    sys.exit(_runloop.run(_main()))
 
 
 if __name__ == "__main__":
@@ -15,23 +15,48 @@ import argparse
 import json
 import sys
 from pathlib import Path
+from typing import Iterator
 
 _REPO_ROOT = Path(__file__).resolve().parent.parent
 _BACKEND = _REPO_ROOT / "backend"
 if _BACKEND.is_dir() and str(_BACKEND) not in sys.path:
     sys.path.insert(0, str(_BACKEND))
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:
+    ijson = None  # type: ignore[assignment]
+
+from _jsonio import json_loads
 from policy.policy_model import Policy
 from policy.policy_runtime import get_active_policy
 from policy.replay import run_replay
 
 
-def load_snapshots(path: Path) -> list[dict]:
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
+def load_snapshots(path: Path) -> Iterator[dict]:
+    """
+    Yield snapshots from a JSON list, or the single snapshot object a file may hold.
+    With ijson a list is streamed item by item, so only one evidence pack is in memory at a time.
+    """
+    with open(path, "rb") as f:
+        if ijson is not None:
+            first = f.read(1)
+            while first.isspace():
+                first = f.read(1)
+            f.seek(0)
+            if first == b"[":
+                yield from ijson.items(f, "item", use_float=True)
+                return
+        data = json_loads(f.read())
     if isinstance(data, list):
-        return data
-    return [data]
+        yield from data
+    else:
+        yield data
 
 
 def load_proposed_policy(path: Path) -> Policy:
@@ -56,8 +81,11 @@ def main() -> int:
     report = run_replay(snapshots, current_policy, proposed_policy)
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2)
+    # One write either way: json.dump would push the report through the 8 KiB text buffer chunk by chunk
+    if orjson is not None:
+        args.output.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        args.output.write_bytes(json.dumps(report, indent=2).encode("utf-8"))
 
     print(f"Replay result: {report['replay_result']}", file=sys.stderr)
     print(f"Wrote {args.output}", file=sys.stderr)
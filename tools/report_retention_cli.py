@@ -1,6 +1,6 @@
 """
 Report retention CLI: deterministic cleanup keeping last N reports.
-Usage: python tools/report_retention_cli.py [--reports-dir reports] [--keep 200] [--dry-run]
+Usage: python tools/report_retention_cli.py [--reports-dir reports] [--keep 200] [--dry-run] [--compact-index]
 Env: REPORT_RETENTION_COUNT (default 200), REPORT_RETENTION_DRY_RUN (default true).
 """
 
@@ -14,8 +14,6 @@ _backend = Path(__file__).resolve().parent.parent / "backend"
 if str(_backend) not in sys.path:
     sys.path.insert(0, str(_backend))
 
-from limits.retention import cleanup_reports
-
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Report retention: keep last N reports, prune rest (under reports dir only)")
@@ -23,9 +21,19 @@ def main() -> int:
     parser.add_argument("--keep", type=int, default=None, help="Keep last N runs (default: REPORT_RETENTION_COUNT or 200)")
     parser.add_argument("--dry-run", action="store_true", help="Do not delete; only list paths that would be removed")
     parser.add_argument("--no-dry-run", action="store_true", help="Actually delete (overrides REPORT_RETENTION_DRY_RUN)")
+    parser.add_argument("--compact-index", action="store_true", help="Only fold pending quality-audit entries (index.qa.jsonl) into index.json; no pruning")
     args = parser.parse_args()
 
+    if args.compact_index:
+        from reports.index_store import compact_quality_audit_runs
+
+        print(compact_quality_audit_runs(Path(args.reports_dir) / "index.json"))
+        return 0
+
     import os
+
+    from limits.retention import cleanup_reports
+
     env_dry = os.environ.get("REPORT_RETENTION_DRY_RUN", "").strip().lower() in ("1", "true", "yes")
     dry_run = args.dry_run or (not args.no_dry_run and env_dry)
 
@@ -35,8 +43,8 @@ def main() -> int:
         dry_run=dry_run,
     )
     if deleted_paths:
-        for p in deleted_paths:
-            print(p)
+        # One write for the whole list: long retention cycles can prune thousands of paths
+        sys.stdout.write("".join(f"{p}\n" for p in deleted_paths))
     if errors:
         print(f"Errors: {errors}", file=sys.stderr)
     return min(errors, 255) if errors else 0
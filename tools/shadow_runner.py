@@ -1,14 +1,12 @@
 """
 CLI for deterministic shadow batch runner.
-Usage: python tools/shadow_runner.py [--connector dummy] [--match-ids id1,id2] [--output shadow_batch_report.json]
+Usage: python tools/shadow_runner.py [--connector dummy] [--match-ids id1,id2] [--output shadow_batch_report.json] [--max-workers N]
 Exits 0 even if some matches fail; failures are listed in the report.
 """
 
 from __future__ import annotations
 
 import argparse
-import asyncio
-import json
 import sys
 from pathlib import Path
 
@@ -17,15 +15,9 @@ _backend = Path(__file__).resolve().parent.parent / "backend"
 if str(_backend) not in sys.path:
     sys.path.insert(0, str(_backend))
 
-import models  # noqa: F401 - register models
-from core.config import get_settings
-from core.database import init_database, dispose_database, get_database_manager
-from runner.shadow_runner import run_shadow_batch
-
-
-def _stable_json(obj: object) -> str:
-    """JSON with sorted keys for deterministic output."""
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+import _runloop
+from _jsonio import stable_json_bytes
+from _lazy import ensure_models, settings
 
 
 async def _main() -> int:
@@ -42,14 +34,26 @@ async def _main() -> int:
         help="Output JSON file path (default: shadow_batch_report.json)",
     )
     parser.add_argument("--dry-run", action="store_true", help="Do not persist SnapshotResolution or write cache")
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=1,
+        help="Run up to N matches concurrently, each in its own DB session (default: 1, sequential)",
+    )
     args = parser.parse_args()
 
+    # Backend imports after argparse so --help / usage errors skip ORM registration
+    from core.database import init_database, dispose_database, get_database_manager
+    from runner.shadow_runner import run_shadow_batch
+
     match_ids = None
     if args.match_ids:
         match_ids = [m.strip() for m in args.match_ids.split(",") if m.strip()]
 
-    settings = get_settings()
-    await init_database(settings.database_url)
+    ensure_models()
+    # One connection for the outer session plus one per concurrent worker (capped at 25); no overflow
+    workers = min(max(args.max_workers, 1), 25)
+    await init_database(settings().database_url, pool_size=1 + workers if workers > 1 else 1, max_overflow=0)
 
     try:
         async with get_database_manager().session() as session:
@@ -58,20 +62,22 @@ async def _main() -> int:
                 connector_name=args.connector,
                 match_ids=match_ids,
                 dry_run=args.dry_run,
+                max_workers=workers,
+                session_factory=get_database_manager().session,
             )
     finally:
         await dispose_database()
 
     out_path = Path(args.output)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(_stable_json(report), encoding="utf-8")
+    out_path.write_bytes(stable_json_bytes(report))
 
     # Exit 0 even if some matches failed; failures are in report["failures"]
     return 0
 
 
 def main() -> None:
-    sys.exit(asyncio.run(_main()))
+    sys.exit(_runloop.run(_main()))
 
 
 if __name__ == "__main__":